@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -39,7 +40,7 @@ def load_config() -> AppConfig:
     global _config
     if _config is None:
         cfg = AppConfig()
-        for directory in [cfg.DATA_DIR, cfg.MODEL_DIR, cfg.OUTPUT_DIR, cfg.DATABASE_DIR]:
-            directory.mkdir(parents=True, exist_ok=True)
+        for directory in (cfg.DATA_DIR, cfg.MODEL_DIR, cfg.OUTPUT_DIR, cfg.DATABASE_DIR):
+            os.makedirs(directory, exist_ok=True)
         _config = cfg
     return _config
\ No newline at end of file
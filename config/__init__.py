@@ -1,7 +1,14 @@
 """Configuration package for Bank Reconciliation AI"""
 
-from .settings import AppSettings
+from .settings import AppSettings, get_app_settings
 from .constants import *
-from .legacy_config import load_config
 
-__all__ = ['AppSettings', 'load_config', 'APP_NAME', 'APP_VERSION']
+__all__ = ['AppSettings', 'get_app_settings', 'load_config', 'APP_NAME', 'APP_VERSION']
+
+
+def __getattr__(name):
+    # Legacy config is only imported by callers that actually need it
+    if name == "load_config":
+        from .legacy_config import load_config
+        return load_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
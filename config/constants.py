@@ -2,8 +2,10 @@
 # Copyright (c) 2025 Arvida Software UK. All rights reserved.
 """Application constants and enums"""
 
-from enum import Enum
+import os
+from enum import StrEnum
 from pathlib import Path
+from typing import Iterable, Optional, Set
 
 # Application info
 APP_NAME = "Bank Reconciliation AI"
@@ -32,44 +34,68 @@ MODEL_DIR = PROJECT_ROOT / "models"
 LOGS_DIR = PROJECT_ROOT / "logs"
 RESOURCES_DIR = PROJECT_ROOT / "resources"
 
-def ensure_directories() -> None:
-    """Create required application directories if they do not exist."""
-    for path in (DATA_DIR, OUTPUT_DIR, MODEL_DIR, LOGS_DIR, RESOURCES_DIR):
-        path.mkdir(parents=True, exist_ok=True)
-
-# Legacy config compatibility
-BANK_FILE = str(DATA_DIR / "bank_statement.csv")
-ERP_FILE = str(DATA_DIR / "erp_transactions.csv")
-TRAINING_FILE = str(DATA_DIR / "training_labels.csv")
-MODEL_PATH = str(MODEL_DIR / "model.pkl")
-REPORT_FILE = str(OUTPUT_DIR / "reconciliation_report.xlsx")
-MATCHED_REPORT_PATH = str(OUTPUT_DIR / "matched_transactions.csv")
-UNMATCHED_REPORT_PATH = str(OUTPUT_DIR / "unmatched_transactions.csv")
+# Directories already created during this process; lets repeat calls skip the
+# filesystem entirely.
+_ensured: Set[Path] = set()
+
+
+def ensure_directories(paths: Optional[Iterable[Path]] = None) -> None:
+    """Create required application directories if they do not exist.
+
+    Args:
+        paths: Directories to create. Defaults to the application directories.
+    """
+    if paths is None:
+        paths = (DATA_DIR, OUTPUT_DIR, MODEL_DIR, LOGS_DIR, RESOURCES_DIR)
+    for path in set(paths) - _ensured:
+        os.makedirs(path, exist_ok=True)
+        _ensured.add(path)
+
+# Legacy config compatibility. Both ``Path`` and ``str`` forms are provided so
+# callers never need to re-parse a string back into a ``Path``.
+BANK_FILE_PATH = DATA_DIR / "bank_statement.csv"
+ERP_FILE_PATH = DATA_DIR / "erp_transactions.csv"
+TRAINING_FILE_PATH = DATA_DIR / "training_labels.csv"
+MODEL_FILE_PATH = MODEL_DIR / "model.pkl"
+REPORT_FILE_PATH = OUTPUT_DIR / "reconciliation_report.xlsx"
+MATCHED_REPORT_FILE_PATH = OUTPUT_DIR / "matched_transactions.csv"
+UNMATCHED_REPORT_FILE_PATH = OUTPUT_DIR / "unmatched_transactions.csv"
+
+BANK_FILE = str(BANK_FILE_PATH)
+ERP_FILE = str(ERP_FILE_PATH)
+TRAINING_FILE = str(TRAINING_FILE_PATH)
+MODEL_PATH = str(MODEL_FILE_PATH)
+REPORT_FILE = str(REPORT_FILE_PATH)
+MATCHED_REPORT_PATH = str(MATCHED_REPORT_FILE_PATH)
+UNMATCHED_REPORT_PATH = str(UNMATCHED_REPORT_FILE_PATH)
 
 
 # Additional configuration constants
 MODEL_VERSION = "v1.0.0"
+# Pickle protocol 5 (PEP 574) lets NumPy-backed models serialise without
+# copying their array buffers
+MODEL_PICKLE_PROTOCOL = 5
 MATCH_CONFIDENCE_THRESHOLD = DEFAULT_CONFIDENCE_THRESHOLD
 
 
-class FileType(Enum):
+class FileType(StrEnum):
     """Supported file types"""
     CSV = "csv"
     EXCEL = "excel"
 
-class Theme(Enum):
+class Theme(StrEnum):
     """UI theme options"""
     LIGHT = "light"
     DARK = "dark"
 
-class MatchStatus(Enum):
+class MatchStatus(StrEnum):
     """Transaction match status"""
     MATCHED = "matched"
     UNMATCHED = "unmatched"
     PENDING = "pending"
     REVIEWED = "reviewed"
 
-class BankType(Enum):
+class BankType(StrEnum):
     LLOYDS = "lloyds"
     RBS_NATWEST = "natwest"
     BARCLAYS = "barclays"
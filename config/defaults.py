@@ -4,102 +4,136 @@ Single source of truth for all default configurations.
 This eliminates duplication across multiple classes.
 """
 
-from typing import Dict, Any, List
-from dataclasses import dataclass
+import re
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, NamedTuple, Tuple
 
-@dataclass
-class DefaultBankAccount:
+
+def _keywords(*words: str) -> Tuple[str, ...]:
+    """Return an immutable tuple of interned, lowercased keyword strings."""
+    return tuple(sys.intern(word.lower()) for word in words)
+
+
+# Template and format names are shared keys across modules; interning them
+# lets dict lookups and comparisons short-circuit on identity.
+_LLOYDS = sys.intern("lloyds")
+_RBS_NATWEST = sys.intern("rbs/natwest")
+_UK_STANDARD = sys.intern("UK_STANDARD")
+_UK_BUSINESS = sys.intern("UK_BUSINESS")
+_GBP = sys.intern("GBP")
+
+
+class DefaultBankAccount(NamedTuple):
     account_number: str
     sort_code: str
     transformer: str
     erp_account_code: str
     erp_account_name: str
-    statement_format: str = "UK_STANDARD"
-    currency: str = "GBP"
+    statement_format: str = _UK_STANDARD
+    currency: str = _GBP
 
-@dataclass
-class DefaultBankTemplate:
+class DefaultBankTemplate(NamedTuple):
+    """Default parsing rules for a bank statement layout.
+
+    ``header_keywords``, ``skip_keywords`` and the ``column_mapping`` values
+    are stored lowercase so parsers can compare them against lowercased cell
+    text without lowering the keywords again for every row.
+    """
     name: str
     bank_type: str
-    header_keywords: List[str]
-    date_patterns: List[str]
-    skip_keywords: List[str]
-    column_mapping: Dict[str, List[str]]
+    header_keywords: Tuple[str, ...]
+    date_patterns: Tuple[str, ...]
+    skip_keywords: Tuple[str, ...]
+    column_mapping: Mapping[str, Tuple[str, ...]]
     description: str
 
 # SINGLE SOURCE OF TRUTH FOR DEFAULT ACCOUNTS
-DEFAULT_BANK_ACCOUNTS: Dict[str, DefaultBankAccount] = {
+_DEFAULT_BANK_ACCOUNTS: Dict[str, DefaultBankAccount] = {
     "Main Current Account": DefaultBankAccount(
         account_number="01584534",
         sort_code="30-96-96",
-        transformer="lloyds",  # Use consistent template names
+        transformer=_LLOYDS,  # Use consistent template names
         erp_account_code="152000",
         erp_account_name="Lloyds Main Account"
     ),
     "RBS-Natwest Account": DefaultBankAccount(
         account_number="87654321", 
         sort_code="65-43-21",
-        transformer="rbs/natwest",  # Use consistent template names
+        transformer=_RBS_NATWEST,  # Use consistent template names
         erp_account_code="150600",
         erp_account_name="RBS-Natwest Bank Account",
-        statement_format="UK_BUSINESS"
+        statement_format=_UK_BUSINESS
     ),
     "Charity Business Account": DefaultBankAccount(
         account_number="01586871",
         sort_code="30-96-96", 
-        transformer="lloyds",  # Use consistent template names
+        transformer=_LLOYDS,  # Use consistent template names
         erp_account_code="153100",
         erp_account_name="Charity Bank Account"
     )
 }
+DEFAULT_BANK_ACCOUNTS: Mapping[str, DefaultBankAccount] = MappingProxyType(_DEFAULT_BANK_ACCOUNTS)
 
 # SINGLE SOURCE OF TRUTH FOR DEFAULT TEMPLATES
-DEFAULT_BANK_TEMPLATES: Dict[str, DefaultBankTemplate] = {
-    "lloyds": DefaultBankTemplate(
+_DEFAULT_BANK_TEMPLATES: Dict[str, DefaultBankTemplate] = {
+    _LLOYDS: DefaultBankTemplate(
         name="Lloyds Bank",
-        bank_type="lloyds",
-        header_keywords=["posting date", "date", "type", "details", "debits", "credits"],
-        date_patterns=[
+        bank_type=_LLOYDS,
+        header_keywords=_keywords("posting date", "date", "type", "details", "debits", "credits"),
+        date_patterns=(
             r"\d{1,2}[-/]\w{3}[-/]\d{4}",      # 11-Apr-2025
             r"\d{1,2}[-/]\d{1,2}[-/]\d{4}",    # 11/04/2025
-        ],
-        skip_keywords=["totals", "balance", "end of report", "closing", "opening"],
+        ),
+        skip_keywords=_keywords("totals", "balance", "end of report", "closing", "opening"),
         column_mapping={
-            "date": ["posting date", "date", "transaction date"],
-            "type": ["type", "transaction type"],
-            "description": ["details", "description", "reference"],
-            "debit": ["debit", "debits", "payment", "out"],
-            "credit": ["credit", "credits", "receipt", "deposit"]
+            "date": _keywords("posting date", "date", "transaction date"),
+            "type": _keywords("type", "transaction type"),
+            "description": _keywords("details", "description", "reference"),
+            "debit": _keywords("debit", "debits", "payment", "out"),
+            "credit": _keywords("credit", "credits", "receipt", "deposit")
         },
         description="Standard Lloyds Bank statement format"
     ),
     
-    "rbs/natwest": DefaultBankTemplate(
+    _RBS_NATWEST: DefaultBankTemplate(
         name="NatWest/RBS Bank", 
-        bank_type="rbs/natwest",
-        header_keywords=["date", "narrative #1", "narrative #2", "type", "debit", "credit"],
-        date_patterns=[
+        bank_type=_RBS_NATWEST,
+        header_keywords=_keywords("date", "narrative #1", "narrative #2", "type", "debit", "credit"),
+        date_patterns=(
             r"\d{1,2}/\d{1,2}/\d{2,4}",        # 2/28/25, 02/28/2025
             r"\d{1,2}-\d{1,2}-\d{2,4}",        # 2-28-25, 02-28-2025  
             r"\d{4}-\d{1,2}-\d{1,2}"           # 2025-02-28
-        ],
-        skip_keywords=["Sort Code", "Account Number", "BIC", "Bank Name"],
+        ),
+        skip_keywords=_keywords("Sort Code", "Account Number", "BIC", "Bank Name"),
         column_mapping={
-            "date": ["date", "transaction date"],
-            "type": ["type", "transaction type"],
-            "description": ["narrative #1", "narrative #2", "Narrative #3", "Narrative #4", "Narrative #5"],
-            "debit": ["debit", "debits"],
-            "credit": ["credit", "credits"]
+            "date": _keywords("date", "transaction date"),
+            "type": _keywords("type", "transaction type"),
+            "description": _keywords("narrative #1", "narrative #2", "Narrative #3", "Narrative #4", "Narrative #5"),
+            "debit": _keywords("debit", "debits"),
+            "credit": _keywords("credit", "credits")
         },
         description="NatWest and RBS statement format"
     )
 }
+DEFAULT_BANK_TEMPLATES: Mapping[str, DefaultBankTemplate] = MappingProxyType(_DEFAULT_BANK_TEMPLATES)
+
+# Date patterns compiled once at import so parsers never recompile per row
+COMPILED_DATE_PATTERNS: Dict[str, Tuple[re.Pattern, ...]] = {
+    name: tuple(re.compile(pattern) for pattern in template.date_patterns)
+    for name, template in DEFAULT_BANK_TEMPLATES.items()
+}
 
 # LEGACY TRANSFORMER MAPPINGS (for backward compatibility)
-LEGACY_TRANSFORMER_MAPPINGS = {
-    'standard_uk_bank': 'lloyds',
-    'Natwest_bank': 'rbs/natwest', 
-    'Charity_bank': 'lloyds',
-    'natwest': 'rbs/natwest',
-    'rbs': 'rbs/natwest'
-}
\ No newline at end of file
+# Keys are casefolded so callers can resolve any capitalisation with one lookup:
+# ``LEGACY_TRANSFORMER_MAPPINGS.get(name.casefold(), name)``
+_LEGACY_TRANSFORMER_MAPPINGS = {
+    'standard_uk_bank': _LLOYDS,
+    'Natwest_bank': _RBS_NATWEST,
+    'Charity_bank': _LLOYDS,
+    'natwest': _RBS_NATWEST,
+    'rbs': _RBS_NATWEST
+}
+LEGACY_TRANSFORMER_MAPPINGS: Mapping[str, str] = MappingProxyType(
+    {key.casefold(): value for key, value in _LEGACY_TRANSFORMER_MAPPINGS.items()}
+)
@@ -7,30 +7,38 @@ This module provides the old config.py functionality within the config package.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar
+
+from .constants import DATA_DIR, MODEL_DIR, OUTPUT_DIR, PROJECT_ROOT as _BASE_DIR, ensure_directories
+
 
 @dataclass
 class AppConfig:
-    """Application configuration values."""
-    BASE_DIR: Path = Path(__file__).parent.parent
-    DATA_DIR: Path = BASE_DIR / "data"
-    MODEL_DIR: Path = BASE_DIR / "models"
-    OUTPUT_DIR: Path = BASE_DIR / "output"
-    TEST_DATA_DIR: Path = BASE_DIR / "test_data"
-    DATABASE_DIR: Path = BASE_DIR / "database"
-
-    DATABASE_PATH: Path = DATABASE_DIR / "reconciliation.db"
+    """Application configuration values.
+
+    Paths are fixed for the lifetime of the process, so they are computed once
+    as class variables; only the scalar settings are per-instance fields.
+    """
+    BASE_DIR: ClassVar[Path] = _BASE_DIR
+    DATA_DIR: ClassVar[Path] = DATA_DIR
+    MODEL_DIR: ClassVar[Path] = MODEL_DIR
+    OUTPUT_DIR: ClassVar[Path] = OUTPUT_DIR
+    TEST_DATA_DIR: ClassVar[Path] = _BASE_DIR / "test_data"
+    DATABASE_DIR: ClassVar[Path] = _BASE_DIR / "database"
+
+    DATABASE_PATH: ClassVar[Path] = DATABASE_DIR / "reconciliation.db"
     BACKUP_RETENTION_DAYS: int = 30
     AUTO_BACKUP_ENABLED: bool = True
 
-    BANK_FILE: Path = TEST_DATA_DIR / "sample_bank.csv"
-    ERP_FILE: Path = TEST_DATA_DIR / "sample_erp.csv"
-    TRAINING_FILE: Path = TEST_DATA_DIR / "sample_training.csv"
-    MODEL_PATH: Path = MODEL_DIR / "reconciliation_model.pkl"
-    MATCHED_REPORT_PATH: Path = OUTPUT_DIR / "matched_transactions.csv"
-    UNMATCHED_REPORT_PATH: Path = OUTPUT_DIR / "unmatched_transactions.csv"
-    REPORT_FILE: Path = OUTPUT_DIR / "reconciliation_report.xlsx"
+    BANK_FILE: ClassVar[Path] = TEST_DATA_DIR / "sample_bank.csv"
+    ERP_FILE: ClassVar[Path] = TEST_DATA_DIR / "sample_erp.csv"
+    TRAINING_FILE: ClassVar[Path] = TEST_DATA_DIR / "sample_training.csv"
+    MODEL_PATH: ClassVar[Path] = MODEL_DIR / "reconciliation_model.pkl"
+    MATCHED_REPORT_PATH: ClassVar[Path] = OUTPUT_DIR / "matched_transactions.csv"
+    UNMATCHED_REPORT_PATH: ClassVar[Path] = OUTPUT_DIR / "unmatched_transactions.csv"
+    REPORT_FILE: ClassVar[Path] = OUTPUT_DIR / "reconciliation_report.xlsx"
 
     MATCH_CONFIDENCE_THRESHOLD: float = 0.7
     MODEL_VERSION: str = "v1.0.0"
@@ -39,15 +47,15 @@ class AppConfig:
     ERP_POSITIVE_CREDITS: bool = False
 
 
-_config: Optional[AppConfig] = None
+def ensure_config_directories() -> None:
+    """Create the directories referenced by :class:`AppConfig`."""
+    ensure_directories(
+        (AppConfig.DATA_DIR, AppConfig.MODEL_DIR, AppConfig.OUTPUT_DIR, AppConfig.DATABASE_DIR)
+    )
 
 
+@lru_cache(maxsize=1)
 def load_config() -> AppConfig:
     """Return a singleton application configuration."""
-    global _config
-    if _config is None:
-        cfg = AppConfig()
-        for directory in [cfg.DATA_DIR, cfg.MODEL_DIR, cfg.OUTPUT_DIR, cfg.DATABASE_DIR]:
-            directory.mkdir(parents=True, exist_ok=True)
-        _config = cfg
-    return _config
+    ensure_config_directories()
+    return AppConfig()
@@ -2,127 +2,169 @@
 # Copyright (c) 2025 Arvida Software UK. All rights reserved.
 """Application settings management"""
 
-try:
-    from PySide6.QtCore import QSettings
-except ImportError:  # Provide minimal stub for non-GUI environments
-    class QSettings(dict):
-        def __init__(self, *_, **__):
-            self.store = {}
-
-        def value(self, key, default=None):
-            return self.store.get(key, default)
-
-        def setValue(self, key, value):
-            self.store[key] = value
-
-        def sync(self):
-            pass
+from functools import lru_cache
 from typing import Optional, Any
 import logging
 from .constants import *
 
+
+class _StubQSettings(dict):
+    """Minimal stand-in for ``QSettings`` in non-GUI environments."""
+
+    def __init__(self, *_, **__):
+        self.store = {}
+        self._groups = []
+
+    def _key(self, key):
+        return "/".join([*self._groups, key])
+
+    def beginGroup(self, prefix):
+        self._groups.append(prefix)
+
+    def endGroup(self):
+        self._groups.pop()
+
+    def value(self, key, default=None):
+        return self.store.get(self._key(key), default)
+
+    def setValue(self, key, value):
+        self.store[self._key(key)] = value
+
+    def allKeys(self):
+        return list(self.store)
+
+    def sync(self):
+        pass
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert a stored setting to ``bool``, normalising string values."""
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes", "y")
+    return bool(value)
+
+
+# (attribute, settings key, type caster, default) for every setting loaded
+# directly from storage. A caster of ``None`` keeps the stored value as is.
+_SETTINGS_SCHEMA = (
+    # Legacy single threshold (kept for backward compatibility)
+    ("confidence_threshold", "matching/confidence_threshold", float, DEFAULT_CONFIDENCE_THRESHOLD),
+    ("medium_confidence_threshold", "matching/medium_confidence_threshold", float, 0.60),
+    ("amount_tolerance", "matching/amount_tolerance", float, 0.01),
+    ("amount_percentage_tolerance", "matching/amount_percentage_tolerance", float, 0.5),
+    ("date_tolerance_days", "matching/date_tolerance_days", int, 1),
+    ("description_similarity_threshold", "matching/description_similarity_threshold", float, 0.80),
+    ("auto_match_high_confidence", "matching/auto_match_high_confidence", _to_bool, True),
+    ("flag_low_confidence_for_review", "matching/flag_low_confidence_for_review", _to_bool, True),
+    ("max_combinations", "matching/max_combinations", int, 50000),
+    # ML settings
+    ("auto_retrain", "ml/auto_retrain", _to_bool, False),
+    ("retrain_threshold", "ml/retrain_threshold", int, AUTO_RETRAIN_THRESHOLD),
+    # File paths
+    ("last_bank_dir", "files/last_bank_dir", None, ""),
+    ("last_erp_dir", "files/last_erp_dir", None, ""),
+    ("last_export_dir", "files/last_export_dir", None, ""),
+    # UI preferences
+    ("theme", "ui/theme", None, "light"),
+    ("table_row_height", "ui/table_row_height", int, TABLE_ROW_HEIGHT),
+)
+
+
 class AppSettings:
     """Application settings management using QSettings"""
 
     def __init__(self):
+        # Qt is only loaded once settings are actually constructed so that
+        # importing the config package stays cheap for headless callers.
+        try:
+            from PySide6.QtCore import QSettings
+        except ImportError:
+            QSettings = _StubQSettings
         self.settings = QSettings(ORGANIZATION_NAME, APP_NAME)
         self.logger = logging.getLogger(__name__)
         self.load_settings()
 
-    def _get_bool(self, key: str, default: bool) -> bool:
-        """Retrieve a boolean setting, normalising string values."""
-        value = self.settings.value(key, default)
-        if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes", "y")
-        return bool(value)
-
     def load_settings(self) -> None:
         """Load settings from storage"""
+        # Fetch every stored key in one pass rather than hitting the
+        # platform backend once per setting.
+        self._cache = {key: self.settings.value(key) for key in self.settings.allKeys()}
+
         # Window settings
-        self.window_geometry = self.settings.value("window/geometry")
-        self.window_state = self.settings.value("window/state")
-        
-        # Application settings
-        # Legacy single threshold (kept for backward compatibility)
-        self.confidence_threshold = float(
-            self.settings.value("matching/confidence_threshold", DEFAULT_CONFIDENCE_THRESHOLD)
-        )
+        self.window_geometry = self._cache.get("window/geometry")
+        self.window_state = self._cache.get("window/state")
+
+        for attr, key, caster, default in _SETTINGS_SCHEMA:
+            value = self._cache.get(key, default)
+            setattr(self, attr, caster(value) if caster else value)
 
-        # Advanced matching thresholds
+        # Advanced matching threshold falls back to the legacy single threshold
         self.high_confidence_threshold = float(
-            self.settings.value("matching/high_confidence_threshold", self.confidence_threshold)
-        )
-        self.medium_confidence_threshold = float(
-            self.settings.value("matching/medium_confidence_threshold", 0.60)
-        )
-        self.amount_tolerance = float(
-            self.settings.value("matching/amount_tolerance", 0.01)
-        )
-        self.amount_percentage_tolerance = float(
-            self.settings.value("matching/amount_percentage_tolerance", 0.5)
-        )
-        self.date_tolerance_days = int(
-            self.settings.value("matching/date_tolerance_days", 1)
-        )
-        self.description_similarity_threshold = float(
-            self.settings.value("matching/description_similarity_threshold", 0.80)
-        )
-        self.auto_match_high_confidence = self._get_bool(
-            "matching/auto_match_high_confidence", True
-        )
-        self.flag_low_confidence_for_review = self._get_bool(
-            "matching/flag_low_confidence_for_review", True
-        )
-        self.max_combinations = int(
-            self.settings.value("matching/max_combinations", 50000)
+            self._cache.get("matching/high_confidence_threshold", self.confidence_threshold)
         )
 
-        # ML settings
-        self.auto_retrain = self._get_bool("ml/auto_retrain", False)
-        self.retrain_threshold = int(self.settings.value("ml/retrain_threshold", AUTO_RETRAIN_THRESHOLD))
-        
-        # File paths
-        self.last_bank_dir = self.settings.value("files/last_bank_dir", "")
-        self.last_erp_dir = self.settings.value("files/last_erp_dir", "")
-        self.last_export_dir = self.settings.value("files/last_export_dir", "")
-        
-        # UI preferences
-        self.theme = self.settings.value("ui/theme", "light")
-        self.table_row_height = int(self.settings.value("ui/table_row_height", TABLE_ROW_HEIGHT))
-        
+    def _write_group(self, group: str, values: dict) -> None:
+        """Write ``values`` under a single settings group."""
+        self.settings.beginGroup(group)
+        try:
+            for key, value in values.items():
+                self.settings.setValue(key, value)
+        finally:
+            self.settings.endGroup()
+
     def save(self) -> None:
         """Save current settings"""
         try:
+            window = {}
             if hasattr(self, 'window_geometry') and self.window_geometry:
-                self.settings.setValue("window/geometry", self.window_geometry)
+                window["geometry"] = self.window_geometry
             if hasattr(self, 'window_state') and self.window_state:
-                self.settings.setValue("window/state", self.window_state)
-            
+                window["state"] = self.window_state
+
             # Legacy single threshold mirrors the high confidence threshold
             self.confidence_threshold = self.high_confidence_threshold
-            self.settings.setValue("matching/confidence_threshold", self.confidence_threshold)
-            self.settings.setValue("matching/high_confidence_threshold", self.high_confidence_threshold)
-            self.settings.setValue("matching/medium_confidence_threshold", self.medium_confidence_threshold)
-            self.settings.setValue("matching/amount_tolerance", self.amount_tolerance)
-            self.settings.setValue("matching/amount_percentage_tolerance", self.amount_percentage_tolerance)
-            self.settings.setValue("matching/date_tolerance_days", self.date_tolerance_days)
-            self.settings.setValue("matching/description_similarity_threshold", self.description_similarity_threshold)
-            self.settings.setValue("matching/auto_match_high_confidence", self.auto_match_high_confidence)
-            self.settings.setValue("matching/flag_low_confidence_for_review", self.flag_low_confidence_for_review)
-            self.settings.setValue("matching/max_combinations", self.max_combinations)
-            self.settings.setValue("ml/auto_retrain", self.auto_retrain)
-            self.settings.setValue("ml/retrain_threshold", self.retrain_threshold)
-            
-            self.settings.setValue("files/last_bank_dir", self.last_bank_dir)
-            self.settings.setValue("files/last_erp_dir", self.last_erp_dir)
-            self.settings.setValue("files/last_export_dir", self.last_export_dir)
-            
-            self.settings.setValue("ui/theme", self.theme)
-            self.settings.setValue("ui/table_row_height", self.table_row_height)
-            
+
+            groups = {
+                "window": window,
+                "matching": {
+                    "confidence_threshold": self.confidence_threshold,
+                    "high_confidence_threshold": self.high_confidence_threshold,
+                    "medium_confidence_threshold": self.medium_confidence_threshold,
+                    "amount_tolerance": self.amount_tolerance,
+                    "amount_percentage_tolerance": self.amount_percentage_tolerance,
+                    "date_tolerance_days": self.date_tolerance_days,
+                    "description_similarity_threshold": self.description_similarity_threshold,
+                    "auto_match_high_confidence": self.auto_match_high_confidence,
+                    "flag_low_confidence_for_review": self.flag_low_confidence_for_review,
+                    "max_combinations": self.max_combinations,
+                },
+                "ml": {
+                    "auto_retrain": self.auto_retrain,
+                    "retrain_threshold": self.retrain_threshold,
+                },
+                "files": {
+                    "last_bank_dir": self.last_bank_dir,
+                    "last_erp_dir": self.last_erp_dir,
+                    "last_export_dir": self.last_export_dir,
+                },
+                "ui": {
+                    "theme": self.theme,
+                    "table_row_height": self.table_row_height,
+                },
+            }
+            for group, values in groups.items():
+                if values:
+                    self._write_group(group, values)
+
             self.settings.sync()
             self.logger.debug("Settings saved")
             
         except (TypeError, OSError) as e:
             self.logger.error("Failed to save settings: %s", e)
             raise
+
+
+@lru_cache(maxsize=1)
+def get_app_settings() -> AppSettings:
+    """Return a shared :class:`AppSettings` instance."""
+    return AppSettings()
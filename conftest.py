@@ -1,47 +1,50 @@
 """Test configuration utilities."""
 
+import importlib.abc
+import importlib.util
 import sys
-import types
 
+# Heavy training submodules and the placeholder classes each stub exposes
+_TRAINING_STUBS = {
+    # Core training service stub (used by MLEngine tests)
+    "models.ml.training.trainer": ("ModelTrainingConfig", "TrainingDataset", "TrainingService"),
+    # Stub modules referenced by the training package's __init__
+    "models.ml.training.data_processor": ("FeatureExtractor", "DataQualityAnalyzer", "DatasetBuilder"),
+    "models.ml.training.model_factory": ("ModelFactory",),
+    "models.ml.training.cross_validator": ("CrossValidator",),
+    "models.ml.training.hyperparameter_tuner": ("HyperparameterTuner",),
+    "models.ml.training.self_learning": ("SelfLearningManager",),
+    "models.ml.training.training_orchestrator": ("TrainingOrchestrator",),
+}
 
-def stub_training_modules() -> None:
-    """Insert lightweight stubs for heavy training submodules.
 
-    The real implementations pull in optional dependencies like NumPy and
-    scikit-learn which aren't required for the lightweight unit tests. By
-    providing simple stand-ins we can import ``models.ml.training`` and modules
-    depending on it without installing those packages.
-    """
+class _TrainingStubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Materialise training stubs only when one is actually imported."""
 
-    # Core training service stub (used by MLEngine tests)
-    trainer_stub = types.ModuleType("models.ml.training.trainer")
+    def find_spec(self, fullname, path, target=None):
+        if fullname in _TRAINING_STUBS:
+            return importlib.util.spec_from_loader(fullname, self)
+        return None
+
+    def create_module(self, spec):
+        return None
 
-    class ModelTrainingConfig:  # pragma: no cover - lightweight placeholder
-        pass
+    def exec_module(self, module) -> None:
+        for attr in _TRAINING_STUBS[module.__name__]:
+            setattr(module, attr, type(attr, (), {}))
 
-    class TrainingDataset:  # pragma: no cover - lightweight placeholder
-        pass
 
-    class TrainingService:  # pragma: no cover - lightweight placeholder
-        pass
+_finder = _TrainingStubFinder()
 
-    trainer_stub.ModelTrainingConfig = ModelTrainingConfig
-    trainer_stub.TrainingDataset = TrainingDataset
-    trainer_stub.TrainingService = TrainingService
-    sys.modules.setdefault("models.ml.training.trainer", trainer_stub)
 
-    # Stub modules referenced by the training package's __init__
-    modules = {
-        "models.ml.training.data_processor": ("FeatureExtractor", "DataQualityAnalyzer", "DatasetBuilder"),
-        "models.ml.training.model_factory": ("ModelFactory",),
-        "models.ml.training.cross_validator": ("CrossValidator",),
-        "models.ml.training.hyperparameter_tuner": ("HyperparameterTuner",),
-        "models.ml.training.self_learning": ("SelfLearningManager",),
-        "models.ml.training.training_orchestrator": ("TrainingOrchestrator",),
-    }
-
-    for name, attrs in modules.items():
-        module = types.ModuleType(name)
-        for attr in attrs:
-            setattr(module, attr, type(attr, (), {}))
-        sys.modules.setdefault(name, module)
\ No newline at end of file
+def stub_training_modules() -> None:
+    """Insert lightweight stubs for heavy training submodules.
+
+    The real implementations pull in optional dependencies like NumPy and
+    scikit-learn which aren't required for the lightweight unit tests. By
+    providing simple stand-ins we can import ``models.ml.training`` and modules
+    depending on it without installing those packages. Modules that are
+    already imported are left untouched.
+    """
+    if _finder not in sys.meta_path:
+        sys.meta_path.insert(0, _finder)
@@ -9,6 +9,7 @@
 Bank Reconciliation AI - Main Application Entry Point
 """
 
+import hashlib
 import logging
 import re
 from pathlib import Path
@@ -22,13 +23,16 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from config.constants import ensure_directories
-from config.settings import AppSettings
+from config.legacy_config import ensure_config_directories
+from config.settings import get_app_settings
 from services.event_bus import EventBus
 from services.logging_service import setup_logging
 from views.main_window import MainWindow
 
 logger = logging.getLogger(__name__)
 
+_QSS_IMPORT_PATTERN = re.compile(r"@import\s+url\([\"']?([^\"')]+)[\"']?\);?")
+
 def main():
     """Main application entry point"""
 
@@ -36,6 +40,7 @@ def main():
 
         # Ensure required directories exist
         ensure_directories()
+        ensure_config_directories()
 
         # Setup logging
         setup_logging()
@@ -52,7 +57,7 @@ def main():
         app.setOrganizationName("Arvida Software UK")
 
         # Load settings
-        settings = AppSettings()
+        settings = get_app_settings()
         
         # Initialize event bus
         event_bus = EventBus()
@@ -89,6 +94,10 @@ def load_application_stylesheet(app):
     the referenced component stylesheets. In addition to processing any
     imports found in ``main.qss``, the button, combobox and table component
     styles are always concatenated with the base stylesheet.
+
+    The combined stylesheet is cached under ``resources/styles/.cache`` keyed
+    on the modification times of the source files, so warm starts read a
+    single file instead of rebuilding it.
     """
     try:
         stylesheet_path = Path(__file__).parent / "resources" / "styles" / "main.qss"
@@ -96,49 +105,68 @@ def load_application_stylesheet(app):
             logger.warning(f"Stylesheet not found: {stylesheet_path}")
             return
 
-        # Read base stylesheet and replace any @import directives with the
-        # contents of the referenced file.
-        base_content = stylesheet_path.read_text(encoding="utf-8").splitlines()
-        import_pattern = re.compile(
-            r"@import\s+url\([\"']?([^\"')]+)[\"']?\);?"
+        cache_dir = stylesheet_path.parent / ".cache"
+        sources = sorted(
+            path for path in stylesheet_path.parent.rglob("*.qss")
+            if cache_dir not in path.parents
         )
-        final_styles = []
-        imported_files = set()
-
-        for line in base_content:
-            match = import_pattern.search(line.strip())
-            if match:
-                import_file = stylesheet_path.parent / match.group(1)
-                if import_file.exists():
-                    final_styles.append(import_file.read_text(encoding="utf-8"))
-                    imported_files.add(import_file.resolve())
-                else:
-                    logger.warning(f"Imported stylesheet not found: {import_file}")
-            else:
-                final_styles.append(line)
-
-        # Ensure specific component styles are included even if they were not
-        # explicitly imported.
-        components = [
-            "components/buttons.qss",
-            "components/comboboxes.qss",
-            "components/tables.qss",
-        ]
-        for component in components:
-            comp_path = stylesheet_path.parent / component
-            resolved = comp_path.resolve()
-            if comp_path.exists() and resolved not in imported_files:
-                final_styles.append(comp_path.read_text(encoding="utf-8"))
-                imported_files.add(resolved)
-            elif not comp_path.exists():
-                logger.warning(f"Stylesheet not found: {comp_path}")
-
-        app.setStyleSheet("\n".join(final_styles))
+        key = repr(tuple((str(path), path.stat().st_mtime_ns) for path in sources))
+        cache_file = cache_dir / f"{hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()}.qss"
+
+        if cache_file.exists():
+            stylesheet = cache_file.read_text(encoding="utf-8")
+        else:
+            stylesheet = _build_application_stylesheet(stylesheet_path)
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                for stale in cache_dir.glob("*.qss"):
+                    stale.unlink()
+                cache_file.write_text(stylesheet, encoding="utf-8")
+            except OSError as e:
+                logger.debug(f"Could not cache stylesheet: {e}")
+
+        app.setStyleSheet(stylesheet)
         logger.info("Application stylesheet loaded successfully")
     except Exception as e:
         logger.error(f"Failed to load stylesheet: {e}")
 
 
+def _build_application_stylesheet(stylesheet_path: Path) -> str:
+    """Return ``main.qss`` with its imports and core components inlined."""
+    # Replace any @import directives with the contents of the referenced
+    # file in a single pass over the base stylesheet.
+    imported_files = set()
+
+    def inline_import(match: re.Match) -> str:
+        import_file = stylesheet_path.parent / match.group(1)
+        if not import_file.exists():
+            logger.warning(f"Imported stylesheet not found: {import_file}")
+            return ""
+        imported_files.add(import_file.resolve())
+        return import_file.read_text(encoding="utf-8")
+
+    final_styles = [
+        _QSS_IMPORT_PATTERN.sub(inline_import, stylesheet_path.read_text(encoding="utf-8"))
+    ]
+
+    # Ensure specific component styles are included even if they were not
+    # explicitly imported.
+    components = [
+        "components/buttons.qss",
+        "components/comboboxes.qss",
+        "components/tables.qss",
+    ]
+    for component in components:
+        comp_path = stylesheet_path.parent / component
+        resolved = comp_path.resolve()
+        if comp_path.exists() and resolved not in imported_files:
+            final_styles.append(comp_path.read_text(encoding="utf-8"))
+            imported_files.add(resolved)
+        elif not comp_path.exists():
+            logger.warning(f"Stylesheet not found: {comp_path}")
+
+    return "\n".join(final_styles)
+
 
 if __name__ == "__main__":
     sys.exit(main())
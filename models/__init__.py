@@ -9,12 +9,15 @@ from .data_models import (
     TransactionMatch, ReconciliationReport
 )
 
-try:  # Optional MLEngine import
-    from .ml_engine import MLEngine  # type: ignore
-except Exception:  # pragma: no cover - optional
-    MLEngine = None  # type: ignore
-
-__all__ = [
+__all__ = (
     'Transaction', 'BankTransaction', 'ERPTransaction',
     'TransactionMatch', 'ReconciliationReport', 'MLEngine'
-]
+)
+
+
+def __getattr__(name):
+    # MLEngine pulls in the ML stack, so only import it on first use
+    if name == "MLEngine":
+        from .ml_engine import MLEngine
+        return MLEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,7 +14,7 @@ import re
 from datetime import datetime
 
 from .base_file_processor import BaseFileProcessor
-from .data_models import BankTemplate, BankStatement, TransactionData
+from .data_models import BankTemplate, BankStatement, TransactionData, build_header_index
 
 
 logger = logging.getLogger(__name__)
@@ -69,14 +69,17 @@ class BankFileProcessor(BaseFileProcessor):
             
             # Extract headers and find transactions
             headers = self._extract_headers(df, header_row_idx)
-            transaction_indices = self._find_transaction_rows(df, template, header_row_idx)
+            column_map = template.map_columns(build_header_index(headers))
+            transaction_indices = self._find_transaction_rows(df, template, header_row_idx, column_map)
             
             if not transaction_indices:
                 result_info['message'] = "No transaction rows found"
                 return BankStatement("", None, "", []), result_info
             
             # Transform transactions
-            transactions = self._transform_transactions(df, transaction_indices, headers, template)
+            transactions = self._transform_transactions(
+                df, transaction_indices, headers, template, column_map
+            )
             
             # Create bank statement object
             bank_statement = BankStatement(
@@ -104,11 +107,12 @@ class BankFileProcessor(BaseFileProcessor):
             logger.error(f"Transformation error: {e}")
             return BankStatement("", None, "", []), result_info
    
-    def _find_transaction_rows(self, df: pd.DataFrame, template: BankTemplate, header_row_idx: int) -> List[int]:
+    def _find_transaction_rows(self, df: pd.DataFrame, template: BankTemplate, header_row_idx: int,
+                               column_map: Optional[Dict[str, List[int]]] = None) -> List[int]:
         """Find rows containing transaction data."""
         transaction_indices = []
-        headers = self._extract_headers(df, header_row_idx)
-        column_map = template.map_columns(headers)
+        if column_map is None:
+            column_map = template.map_columns(self._extract_headers(df, header_row_idx))
         date_indices = self._ensure_list(column_map.get('date', []))
         date_col_idx = date_indices[0] if date_indices else None
         
@@ -138,9 +142,11 @@ class BankFileProcessor(BaseFileProcessor):
         return transaction_indices
     
     def _transform_transactions(self, df: pd.DataFrame, transaction_indices: List[int], 
-                              headers: List[str], template: BankTemplate) -> List[TransactionData]:
+                              headers: List[str], template: BankTemplate,
+                              column_map: Optional[Dict[str, List[int]]] = None) -> List[TransactionData]:
         """Transform transaction rows to TransactionData objects."""
-        column_map = template.map_columns(headers)
+        if column_map is None:
+            column_map = template.map_columns(headers)
         transactions = []
         
         for row_idx in transaction_indices:
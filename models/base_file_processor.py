@@ -3,14 +3,99 @@
 
 """Shared utilities for reading files and detecting header rows."""
 
+import codecs
+import importlib.util
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Iterable, Iterator, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 import logging
 
+try:  # Optional dependency
+    import chardet  # type: ignore
+except Exception:  # pragma: no cover - optional
+    chardet = None
+
 logger = logging.getLogger(__name__)
-_PLACEHOLDERS = {"", "none", "null", "nan", "n/a", "na"}
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+_HAS_CALAMINE = importlib.util.find_spec("python_calamine") is not None
+_PLACEHOLDERS = frozenset({"", "none", "null", "nan", "n/a", "na"})
+
+# Element-wise "looks like header text" test applied to whole object arrays
+_is_text = np.frompyfunc(lambda val: isinstance(val, str) and len(val.strip()) > 2, 1, 1)
+
+# Encodings a sniffed statement may be opened with; anything else is treated
+# as a detector miss and read as UTF-8
+_DETECTABLE_ENCODINGS = {"utf-8", "utf-8-sig", "iso8859-1", "cp1252"}
+_ENCODING_SNIFF_BYTES = 64 * 1024
+
+# Tried in order when the sniffed encoding fails to decode a file
+_FALLBACK_ENCODINGS = ("latin-1", "cp1252", "iso-8859-1")
+
+
+def _detect_encoding(file_path: Path) -> str:
+    """Guess a CSV file's encoding from its first few kilobytes."""
+    if chardet is None:
+        return "utf-8"
+    try:
+        with open(file_path, "rb") as handle:
+            prefix = handle.read(_ENCODING_SNIFF_BYTES)
+    except OSError:
+        return "utf-8"
+
+    detected = chardet.detect(prefix).get("encoding")
+    try:
+        name = codecs.lookup(detected).name if detected else "utf-8"
+    except LookupError:
+        return "utf-8"
+    if name == "ascii":
+        return "utf-8"
+    return name if name in _DETECTABLE_ENCODINGS else "utf-8"
+
+
+def _decodable_encoding(file_path: Path) -> str:
+    """The detected encoding, or the first fallback, that decodes the whole file.
+
+    Mirrors the fallbacks of ``BaseFileProcessor._read_csv``, but decides up
+    front; a stream can't switch encoding after yielding its first chunks.
+    """
+    for encoding in [_detect_encoding(file_path), *_FALLBACK_ENCODINGS]:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            with open(file_path, "rb") as handle:
+                for block in iter(partial(handle.read, 1 << 20), b""):
+                    decoder.decode(block)
+                decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return _FALLBACK_ENCODINGS[-1]
+
+
+def _has_binary_columns(df: pd.DataFrame) -> bool:
+    """Return True if any column holds raw ``bytes`` values."""
+    for _, column in df.select_dtypes(include="object").items():
+        values = column.dropna()
+        if not values.empty and isinstance(values.iat[0], bytes):
+            return True
+    return False
+
+
+# Parsed frames of recently read files, least recently used first; see
+# ``BaseFileProcessor.read_file``
+_READ_CACHE: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_READ_CACHE_SIZE = 8
+_READ_CACHE_LOCK = threading.Lock()
+# A file changed this recently may be rewritten within the same timestamp
+# tick (up to 2s on FAT), so its stat cannot yet identify its contents
+_RACY_MTIME_NS = 2_000_000_000
+
 
 class BaseFileProcessor:
     """Provides common file reading and header detection helpers."""
@@ -20,33 +105,138 @@ class BaseFileProcessor:
         file_path = Path(file_path)
 
         try:
-            if file_path.suffix.lower() == ".csv":
-                return self._read_csv(file_path, **kwargs)
-            if file_path.suffix.lower() in [".xlsx", ".xls"]:
-                return self._read_excel(file_path, **kwargs)
-            raise ValueError(f"Unsupported file format: {file_path.suffix}")
+            # Unchanged files are served from a small cache; callers get a
+            # copy so their edits never leak into it
+            stat = file_path.stat()
+            kwargs_items = tuple(sorted(kwargs.items()))
+            try:
+                hash(kwargs_items)
+            except TypeError:
+                return self._read_file_uncached(file_path, **kwargs)
+            if time.time_ns() - max(stat.st_mtime_ns, stat.st_ctime_ns) < _RACY_MTIME_NS:
+                return self._read_file_uncached(file_path, **kwargs)
+
+            key = (
+                type(self), str(file_path.resolve()), stat.st_ino, stat.st_size,
+                stat.st_mtime_ns, stat.st_ctime_ns, kwargs_items,
+            )
+            with _READ_CACHE_LOCK:
+                df = _READ_CACHE.get(key)
+                if df is not None:
+                    _READ_CACHE.move_to_end(key)
+            if df is None:
+                df = self._read_file_uncached(file_path, **kwargs)
+                with _READ_CACHE_LOCK:
+                    _READ_CACHE[key] = df
+                    while len(_READ_CACHE) > _READ_CACHE_SIZE:
+                        _READ_CACHE.popitem(last=False)
+            return df.copy()
         except Exception as exc:  # pragma: no cover - logging side effect
             logger.error("Failed to read file %s: %s", file_path, exc)
             raise
 
+    def read_files(
+        self, file_paths: Iterable[Union[str, Path]], max_workers: int = 4, **kwargs
+    ) -> List[pd.DataFrame]:
+        """Read several files concurrently, returning frames in input order.
+
+        Threads are enough here: file I/O and the PyArrow CSV parser both
+        release the GIL. ``kwargs`` are passed to every :meth:`read_file`.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(partial(self.read_file, **kwargs), file_paths))
+
+    def _read_file_uncached(self, file_path: Path, **kwargs) -> pd.DataFrame:
+        if file_path.suffix.lower() == ".csv":
+            return self._read_csv(file_path, **kwargs)
+        if file_path.suffix.lower() in [".xlsx", ".xls"]:
+            return self._read_excel(file_path, **kwargs)
+        raise ValueError(f"Unsupported file format: {file_path.suffix}")
+
+    def read_file_chunked(
+        self,
+        file_path: Union[str, Path],
+        keywords: Optional[List[str]] = None,
+        chunksize: int = 100_000,
+        skip_rows: int = 0,
+        peek_rows: int = 20,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a large CSV statement in chunks, starting at its header row.
+
+        Only the first ``peek_rows`` rows are loaded to locate the header;
+        the remainder of the file is then read ``chunksize`` rows at a time
+        with the header row as column names.
+        """
+        file_path = Path(file_path)
+        if file_path.suffix.lower() != ".csv":
+            raise ValueError(f"Chunked reading only supports CSV files: {file_path}")
+
+        encoding = _decodable_encoding(file_path)
+        peek = self._read_csv(file_path, encoding=encoding, nrows=peek_rows, engine="c")
+        header_row = self.find_header_row(peek, keywords, skip_rows)
+        if header_row is None:
+            raise ValueError(f"Could not find header row in {file_path}")
+
+        # header= counts rows the way the peek did (blank lines skipped),
+        # unlike skiprows=, which counts physical lines
+        yield from pd.read_csv(
+            file_path,
+            encoding=encoding,
+            header=int(header_row),
+            chunksize=chunksize,
+        )
+
     def _read_csv(self, file_path: Path, **kwargs) -> pd.DataFrame:
-        """Read CSV file with encoding detection."""
-        encoding = kwargs.pop("encoding", "utf-8")
+        """Read CSV file with encoding detection.
+
+        Extra keyword arguments are passed to :func:`pandas.read_csv`, so
+        callers may request ``dtype_backend="pyarrow"`` for Arrow-backed
+        columns.
+        """
+        encoding = kwargs.pop("encoding", None) or _detect_encoding(file_path)
         kwargs.setdefault("header", None)
         try:
-            return pd.read_csv(file_path, encoding=encoding, **kwargs)
+            return self._read_csv_with_engine(file_path, encoding, **kwargs)
         except UnicodeDecodeError:
-            for fallback in ["latin-1", "cp1252", "iso-8859-1"]:
+            # Only reached when the detector guessed wrong
+            for fallback in _FALLBACK_ENCODINGS:
                 try:
-                    return pd.read_csv(file_path, encoding=fallback, **kwargs)
+                    return self._read_csv_with_engine(file_path, fallback, **kwargs)
                 except UnicodeDecodeError:
                     continue
             raise
 
+    def _read_csv_with_engine(self, file_path: Path, encoding: str, **kwargs) -> pd.DataFrame:
+        """Parse with the multi-threaded PyArrow engine, falling back to the C engine."""
+        if _HAS_PYARROW and "engine" not in kwargs:
+            try:
+                df = pd.read_csv(file_path, encoding=encoding, engine="pyarrow", **kwargs)
+            except (ImportError, ValueError) as exc:
+                # Unsupported options or rows the Arrow parser cannot handle
+                logger.debug("PyArrow CSV engine rejected %s: %s", file_path, exc)
+            else:
+                # Arrow loads undecodable text as bytes instead of raising, so
+                # let the C engine surface the UnicodeDecodeError instead
+                if not _has_binary_columns(df):
+                    return df
+        return pd.read_csv(file_path, encoding=encoding, **kwargs)
+
     def _read_excel(self, file_path: Path, **kwargs) -> pd.DataFrame:
-        """Read Excel file using appropriate engine."""
-        engine = "openpyxl" if file_path.suffix == ".xlsx" else "xlrd"
+        """Read Excel file using appropriate engine.
+
+        ``.xlsx`` workbooks go through the Rust-based calamine reader when
+        ``python-calamine`` is installed, else openpyxl in read-only mode.
+        """
         kwargs.setdefault("header", None)
+        if file_path.suffix == ".xlsx" and _HAS_CALAMINE:
+            try:
+                return pd.read_excel(file_path, engine="calamine", **kwargs)
+            except (ImportError, ValueError) as exc:
+                logger.debug("Calamine could not read %s: %s", file_path, exc)
+
+        engine = "openpyxl" if file_path.suffix == ".xlsx" else "xlrd"
+        if engine == "openpyxl":
+            kwargs.setdefault("engine_kwargs", {"read_only": True, "data_only": True})
         try:
             return pd.read_excel(file_path, engine=engine, **kwargs)
         except ImportError as exc:  # pragma: no cover - logging side effect
@@ -75,44 +265,51 @@ class BaseFileProcessor:
         if keywords:
             # Normalize keywords by removing spaces and converting to lowercase
             normalized_keywords = [kw.lower().replace(' ', '') for kw in keywords]
+            threshold = max(2, int(len(normalized_keywords) * 0.6))
 
-            for idx in range(skip_rows, min(10, len(df))):
-                row_values = [
-                    str(val).lower().replace(' ', '').strip() if pd.notna(val) else ""
-                    for val in df.iloc[idx]
-                ]
+            start = skip_rows or 0
+            head = df.iloc[start:min(10, len(df))]
+            if head.empty:
+                return None
 
-                # Skip empty rows
-                if not any(val for val in row_values):
-                    continue
+            # Drop blank separator rows before doing any per-cell string work
+            positions = np.flatnonzero(head.notna().any(axis=1).to_numpy())
+            if not positions.size:
+                return None
+            head = head.iloc[positions]
 
-                matches = sum(
-                    1 for keyword in normalized_keywords if any(keyword in val for val in row_values)
-                )
-                # Match at least 60% of keywords with a minimum of 2 matches
-                if matches >= max(2, int(len(normalized_keywords) * 0.6)):
-                    return idx
+            # Normalize every candidate cell once using pandas string kernels
+            cells = head.astype(str).where(head.notna(), "").apply(
+                lambda col: col.str.lower().str.replace(" ", "", regex=False).str.strip()
+            )
+
+            # Rows made only of whitespace are empty too
+            non_empty = (cells != "").any(axis=1).to_numpy()
+            positions, cells = positions[non_empty], cells[non_empty]
+
+            # Count, per row, how many keywords appear in any of its cells
+            matches = np.zeros(len(cells), dtype=int)
+            for keyword in normalized_keywords:
+                matches += cells.apply(
+                    lambda col: col.str.contains(keyword, regex=False)
+                ).any(axis=1).to_numpy()
+
+            # Match at least 60% of keywords with a minimum of 2 matches
+            candidates = np.flatnonzero(matches >= threshold)
+            if candidates.size:
+                return start + int(positions[candidates[0]])
             return None
         
-        # Fallback to text-based heuristics when no keywords provided
-        # Also respect skip_rows parameter
-        best_row: Optional[int] = None
-        max_text = 0
-        
-        for row in df.itertuples(index=True, name=None):
-            idx = row[0]
-            text_count = 0
-            non_null = 0
-            for val in row[1:]:
-                if pd.notna(val):
-                    non_null += 1
-                    if isinstance(val, str) and len(val.strip()) > 2:
-                        text_count += 1
-            if text_count >= 3 and text_count >= non_null * 0.6:
-                if text_count > max_text:
-                    max_text = text_count
-                    best_row = idx
-        return best_row
+        # Fallback to text-based heuristics when no keywords provided,
+        # scoring every row with column-wise reductions
+        values = df.to_numpy(dtype=object)
+        non_null = pd.notna(values).sum(axis=1)
+        text_count = _is_text(values).astype(bool).sum(axis=1)
+
+        valid = (text_count >= 3) & (text_count >= non_null * 0.6)
+        if not valid.any():
+            return None
+        return df.index[int(np.argmax(np.where(valid, text_count, -1)))]
 
     # ------------------------------------------------------------------
     # Shared helper methods
@@ -132,13 +329,18 @@ class BaseFileProcessor:
 
     def _ensure_list(self, v):
         """Allow backward compatibility where column_map[key] could be an int."""
-        return v if isinstance(v, list) else ([v] if isinstance(v, int) else [])
+        # Exact type checks: column maps only ever hold plain lists and ints
+        return v if type(v) is list else ([v] if type(v) is int else [])
 
     def _clean_part(self, val) -> str:
         """Basic cleaner: strip, drop placeholders."""
-        if pd.isna(val):
+        # Most cells are already strings; skip the NA check and str() copy
+        if isinstance(val, str):
+            s = val.strip()
+        elif val is None or pd.isna(val):
             return ""
-        s = str(val).strip()
+        else:
+            s = str(val).strip()
         return "" if s.lower() in _PLACEHOLDERS else s
 
     def _parse_amount(self, amount_str: str) -> float:
@@ -154,4 +356,20 @@ class BaseFileProcessor:
             amount = float(cleaned)
             return -amount if is_negative else amount
         except ValueError:
-            return 0.0
\ No newline at end of file
+            return 0.0
+
+    def _parse_amount_series(self, series: pd.Series) -> np.ndarray:
+        """Vectorized :meth:`_parse_amount` for a whole column of amounts."""
+        cleaned = (
+            series.astype(str)
+            .str.replace("£", "", regex=False)
+            .str.replace(",", "", regex=False)
+            .str.strip()
+        )
+        is_negative = cleaned.str.startswith("-") | (
+            cleaned.str.startswith("(") & cleaned.str.endswith(")")
+        )
+        cleaned = cleaned.str.strip("-()")
+        values = pd.to_numeric(cleaned, errors="coerce").fillna(0.0).to_numpy(dtype=float)
+        values[is_negative.to_numpy(dtype=bool)] *= -1
+        return values
\ No newline at end of file
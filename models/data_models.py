@@ -10,14 +10,24 @@ Data models and entities for bank reconciliation system.
 Incorporates your existing bank transformation functionality.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Dict, Iterator, List, Mapping, Optional, Any, Tuple, Union
 from enum import Enum
+from operator import attrgetter
 from datetime import datetime
+import itertools
 import re
+import secrets
+import string
+import sys
+import time
 import logging
 from pathlib import Path
-import uuid
+
+try:  # Optional dependency
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional
+    np = None
 
 try:  # Optional dependency
     import pandas as pd  # type: ignore
@@ -27,6 +37,55 @@ except Exception:  # pragma: no cover - optional
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Transaction ids: a random per-process prefix plus a counter gives 32 hex
+# characters like uuid4().hex, unique within a run without a urandom call each
+_ID_PREFIX = secrets.token_hex(8)
+_ID_COUNTER = itertools.count()
+
+
+def _new_transaction_id() -> str:
+    return f"{_ID_PREFIX}{next(_ID_COUNTER):016x}"
+
+
+# (monotonic time, ISO timestamp) shared by records created within a second
+_NOW_ISO: Tuple[float, str] = (float('-inf'), '')
+
+
+def _now_iso() -> str:
+    """``datetime.now().isoformat()``, reused for up to a second.
+
+    Default factory for created/generated timestamps, so bulk-built records
+    don't each format their own. Where every record needs its own exact
+    time (query execution logs), call ``datetime.now()`` directly.
+    """
+    global _NOW_ISO
+    t = time.monotonic()
+    if t - _NOW_ISO[0] > 1.0:
+        _NOW_ISO = (t, datetime.now().isoformat())
+    return _NOW_ISO[1]
+
+# ASCII characters dropped when comparing header names; anything non-ASCII
+# is removed afterwards by the ascii encode
+_NORM_KEEP = frozenset(string.ascii_lowercase + string.digits)
+_NORM_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if chr(c) not in _NORM_KEEP))
+
+
+def _normalize_header(s: str) -> str:
+    """Lowercase and strip everything except ``a-z`` and ``0-9``."""
+    return s.lower().translate(_NORM_TABLE).encode('ascii', 'ignore').decode('ascii')
+
+
+def build_header_index(headers: List[str]) -> Dict[str, List[int]]:
+    """Map each normalized header name to the positions it occurs at.
+
+    Build this once per file and pass it to :meth:`BankTemplate.map_columns`
+    when several templates are tried against the same headers.
+    """
+    header_index: Dict[str, List[int]] = {}
+    for i, header in enumerate(headers):
+        header_index.setdefault(_normalize_header(header), []).append(i)
+    return header_index
+
 class TransactionType(Enum):
     """Transaction type enumeration"""
     DEBIT = "debit"
@@ -40,7 +99,7 @@ class BankType(Enum):
     BARCLAYS = "barclays"
     CUSTOM = "custom"
 
-@dataclass
+@dataclass(slots=True)
 class TransactionData:
     """Individual transaction data."""
     date: str
@@ -51,10 +110,16 @@ class TransactionData:
     category: Optional[str] = None
     description_date: Optional[str] = None
     normalized_description: Optional[str] = None
-    transaction_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    # Drawn from a per-process counter when not given; see _new_transaction_id
+    transaction_id: Optional[str] = None
     
     def __post_init__(self):
         """Validate transaction data after initialization"""
+        if self.transaction_id is None:
+            self.transaction_id = _new_transaction_id()
+        # Categories repeat across a statement; share one string object each
+        if type(self.category) is str:
+            self.category = sys.intern(self.category)
         self._validate()
     
     def _validate(self):
@@ -79,11 +144,170 @@ class TransactionData:
         # Allow zero amounts - they might be valid in some contexts
         # if float(self.amount) == 0:
         #     raise ValueError("Invalid amount: amount cannot be zero")
+
+    @classmethod
+    def from_dataframe(cls, df) -> List["TransactionData"]:
+        """Build transactions from a DataFrame with one column per field.
+
+        The whole frame is validated up front, so ``__post_init__`` is not
+        run again for each row. Columns that don't name a field are ignored
+        and missing optional fields take their defaults.
+        """
+        if pd is None:
+            raise ImportError("pandas is required for from_dataframe")
+
+        amounts = cls._validate_frame(df)
+        columns: Dict[str, List[Any]] = {}
+        for f in fields(cls):
+            if f.name == "amount":
+                columns[f.name] = amounts.astype(float).tolist()
+            elif f.name == "transaction_id":
+                ids = (
+                    df[f.name].astype(object).where(df[f.name].notna(), None).tolist()
+                    if f.name in df.columns else [None] * len(df)
+                )
+                columns[f.name] = [i if i is not None else _new_transaction_id() for i in ids]
+            elif f.name in df.columns:
+                column = df[f.name].astype(object)
+                columns[f.name] = column.where(column.notna(), None).tolist()
+                if f.name == "category":
+                    columns[f.name] = [
+                        sys.intern(c) if type(c) is str else c for c in columns[f.name]
+                    ]
+            elif f.default is not MISSING:
+                columns[f.name] = [f.default] * len(df)
+            else:
+                columns[f.name] = [f.default_factory() for _ in range(len(df))]
+
+        names = list(columns)
+        transactions = []
+        for values in zip(*columns.values()):
+            transaction = object.__new__(cls)
+            for name, value in zip(names, values):
+                setattr(transaction, name, value)
+            transactions.append(transaction)
+        return transactions
+
+    @staticmethod
+    def _validate_frame(df):
+        """Vectorized :meth:`_validate`, returning the parsed amount column.
+
+        Raises a single ``ValueError`` listing every offending row index.
+        """
+        missing = [name for name in ("date", "description", "amount") if name not in df.columns]
+        if missing:
+            raise ValueError(f"Missing transaction columns: {missing}")
+
+        def _blank(column):
+            return column.isna() | column.astype(str).str.lower().isin(["nan", "none", ""])
+
+        amounts = pd.to_numeric(df["amount"], errors="coerce")
+        invalid = _blank(df["date"]) | _blank(df["description"]) | amounts.isna()
+        if invalid.any():
+            raise ValueError(f"Invalid transaction rows: {df.index[invalid].tolist()}")
+        return amounts
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'date': self.date,
+            'description': self.description,
+            'amount': self.amount,
+            'reference': self.reference,
+            'original_row_index': self.original_row_index,
+            'category': self.category,
+            'description_date': self.description_date,
+            'normalized_description': self.normalized_description,
+            'transaction_id': self.transaction_id,
+        }
+
+
+# Column order of ``TransactionData.to_dict()`` and ``BankStatement.to_dataframe()``
+_TRANSACTION_COLUMNS = (
+    'date', 'description', 'amount', 'reference', 'original_row_index', 'category',
+    'description_date', 'normalized_description', 'transaction_id',
+)
+_transaction_row = attrgetter(*_TRANSACTION_COLUMNS)
 
 @dataclass
+class TransactionFrame:
+    """Column-oriented (structure-of-arrays) copy of a transaction list.
+
+    Hot paths such as totals and amount comparisons can work on the
+    contiguous ``amount`` array instead of reading one attribute per object.
+    """
+    date: "np.ndarray"
+    description: "np.ndarray"
+    amount: "np.ndarray"
+    reference: "np.ndarray"
+    original_row_index: "np.ndarray"
+    normalized_description: Optional["np.ndarray"] = None
+
+    @classmethod
+    def from_transactions(cls, transactions: List[TransactionData]) -> "TransactionFrame":
+        if np is None:
+            raise ImportError("numpy is required for TransactionFrame")
+        n = len(transactions)
+        return cls(
+            date=np.fromiter((t.date for t in transactions), dtype=object, count=n),
+            description=np.fromiter((t.description for t in transactions), dtype=object, count=n),
+            amount=np.fromiter((float(t.amount) for t in transactions), dtype=float, count=n),
+            reference=np.fromiter((t.reference for t in transactions), dtype=object, count=n),
+            original_row_index=np.fromiter(
+                (t.original_row_index for t in transactions), dtype=np.int64, count=n
+            ),
+        )
+
+    @classmethod
+    def from_dataframe(cls, df) -> "TransactionFrame":
+        """Frame over the columns of an already validated DataFrame.
+
+        ``date``, ``description`` and ``amount`` are required; ``reference``,
+        ``original_row_index`` and ``normalized_description`` are optional.
+        """
+        if np is None:
+            raise ImportError("numpy is required for TransactionFrame")
+        n = len(df)
+
+        def _column(name, dtype, default):
+            if name in df.columns:
+                return df[name].to_numpy(dtype=dtype)
+            return np.full(n, default, dtype=dtype)
+
+        return cls(
+            date=df["date"].to_numpy(dtype=object),
+            description=df["description"].to_numpy(dtype=object),
+            amount=df["amount"].to_numpy(dtype=float),
+            reference=_column("reference", object, None),
+            original_row_index=_column("original_row_index", np.int64, 0),
+            normalized_description=(
+                df["normalized_description"].to_numpy(dtype=object)
+                if "normalized_description" in df.columns else None
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.amount)
+
+    def __iter__(self) -> Iterator[TransactionData]:
+        """Build a :class:`TransactionData` per row, only as they are consumed."""
+        normalized = self.normalized_description
+        if normalized is None:
+            normalized = itertools.repeat(None)
+        for date, description, amount, reference, row_index, norm in zip(
+            self.date, self.description, self.amount.tolist(), self.reference,
+            self.original_row_index.tolist(), normalized,
+        ):
+            yield TransactionData(
+                date=date,
+                description=description,
+                amount=amount,
+                reference=reference,
+                original_row_index=row_index,
+                normalized_description=norm,
+            )
+
+
+@dataclass(slots=True)
 class BankStatement:
     """Bank statement containing multiple transactions."""
     bank_name: str
@@ -91,18 +315,50 @@ class BankStatement:
     statement_date: str
     transactions: List[TransactionData]
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _frame_cache: Optional[Tuple[List[TransactionData], int, TransactionFrame]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if type(self.bank_name) is str:
+            self.bank_name = sys.intern(self.bank_name)
+
+    @property
+    def frame(self) -> TransactionFrame:
+        """Columnar view of ``transactions``, rebuilt when the list is replaced or resized."""
+        transactions = self.transactions
+        cached = self._frame_cache
+        if cached is None or cached[0] is not transactions or cached[1] != len(transactions):
+            cached = self._frame_cache = (
+                transactions, len(transactions), TransactionFrame.from_transactions(transactions)
+            )
+        return cached[2]
     
     def to_dataframe(self):
         """Convert to pandas DataFrame for processing."""
         if pd is None:
             raise ImportError("pandas is required for to_dataframe")
-        return pd.DataFrame([t.to_dict() for t in self.transactions])
+        if not self.transactions:
+            return pd.DataFrame()
+        # Read every field of every row in one C-level pass, then transpose
+        # the rows into columns instead of pivoting one dict per row
+        columns = zip(*map(_transaction_row, self.transactions))
+        return pd.DataFrame(dict(zip(_TRANSACTION_COLUMNS, map(list, columns))), copy=False)
 
     @property
     def transform(self) -> bool:
         """Whether statement has been transformed (has transactions)."""
         return len(self.transactions) > 0
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'bank_name': self.bank_name,
+            'account_number': self.account_number,
+            'statement_date': self.statement_date,
+            'transactions': [t.to_dict() for t in self.transactions],
+            'metadata': self.metadata,
+        }
+
 @dataclass
 class BankTemplate:
     """Template defining bank-specific parsing rules."""
@@ -115,54 +371,108 @@ class BankTemplate:
     skip_rows: int = 0
     description: str = ""
     created_by: str = "system"
-    created_date: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_date: str = field(default_factory=_now_iso)
     is_active: bool = True
     debit_positive: bool = True
-    
+    # Lazily built caches; not part of the template's persisted state
+    _compiled_date_patterns: Optional[Tuple[Tuple[str, ...], List[re.Pattern]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _norm_cache: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _norm_column_mapping: Optional[
+        Tuple[Dict[str, List[str]], Tuple[Tuple[str, Tuple[str, ...]], ...]]
+    ] = field(default=None, init=False, repr=False, compare=False)
+
+    def _get_norm_column_mapping(self) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """``(semantic_name, normalized_names)`` pairs for ``column_mapping``.
+
+        Duplicate names that normalize alike are collapsed. Built once and
+        rebuilt only if ``column_mapping`` is reassigned.
+        """
+        cached = self._norm_column_mapping
+        if cached is not None and cached[0] is self.column_mapping:
+            return cached[1]
+
+        normalized = tuple(
+            (semantic_name, tuple(dict.fromkeys(self._normalize(name) for name in possible_names)))
+            for semantic_name, possible_names in self.column_mapping.items()
+        )
+        self._norm_column_mapping = (self.column_mapping, normalized)
+        return normalized
+
+    def __post_init__(self):
+        # Compile up front so bad patterns are reported when the template loads
+        self._get_compiled_date_patterns()
+
+    def _get_compiled_date_patterns(self) -> List[re.Pattern]:
+        """Compiled ``date_patterns``, recompiled only if the list changes."""
+        key = tuple(self.date_patterns)
+        cached = self._compiled_date_patterns
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        compiled: List[re.Pattern] = []
+        for pattern_str in key:
+            try:
+                compiled.append(re.compile(pattern_str))
+            except re.error:
+                logger.warning(f"Invalid regex pattern: {pattern_str}")
+        self._compiled_date_patterns = (key, compiled)
+        return compiled
+
     def matches_date_pattern(self, text: str) -> bool:
         """Check if text matches any of the bank's date patterns."""
         if not text or len(text) < 6:
             return False
-        
-        for pattern_str in self.date_patterns:
-            try:
-                pattern = re.compile(pattern_str)
-                if pattern.match(text.strip()):
-                    return True
-            except re.error:
-                logger.warning(f"Invalid regex pattern: {pattern_str}")
-                continue
-        return False
+
+        text = text.strip()
+        return any(pattern.match(text) for pattern in self._get_compiled_date_patterns())
     
     def _normalize(self, s: str) -> str:
         """Lowercase and strip all non-alphanumeric characters."""
-        return re.sub(r'[^a-z0-9]', '', s.lower())
+        normalized = self._norm_cache.get(s)
+        if normalized is None:
+            normalized = self._norm_cache[s] = _normalize_header(s)
+        return normalized
 
-    def map_columns(self, headers: List[str]) -> Dict[str, List[int]]:
-        """Map semantic column names to actual header positions."""
-        column_map: Dict[str, List[int]] = {}
-        header_to_indices: Dict[str, List[int]] = {}
+    def to_dict(self) -> Dict[str, Any]:
+        """Persisted template fields; the private lookup caches are omitted."""
+        return {
+            'name': self.name,
+            'bank_type': self.bank_type,
+            'header_keywords': self.header_keywords,
+            'date_patterns': self.date_patterns,
+            'skip_keywords': self.skip_keywords,
+            'column_mapping': self.column_mapping,
+            'skip_rows': self.skip_rows,
+            'description': self.description,
+            'created_by': self.created_by,
+            'created_date': self.created_date,
+            'is_active': self.is_active,
+            'debit_positive': self.debit_positive,
+        }
 
-        # Normalize headers and build a lookup from normalized header -> indices
-        headers_normalized = [ self._normalize(h) for h in headers]
-        
-        for i, h_norm in enumerate(headers_normalized):
-            header_to_indices.setdefault(h_norm, []).append(i)
+    def map_columns(
+        self, headers: Union[List[str], Mapping[str, List[int]]]
+    ) -> Dict[str, List[int]]:
+        """Map semantic column names to actual header positions.
 
+        ``headers`` may be the raw header list or an index prebuilt with
+        :func:`build_header_index`.
+        """
+        header_to_indices = headers if isinstance(headers, Mapping) else build_header_index(headers)
+        column_map: Dict[str, List[int]] = {}
 
-        for semantic_name, possible_names in self.column_mapping.items():
+        for semantic_name, normalized_names in self._get_norm_column_mapping():
             indices_for_semantic: List[int] = []
-            for name in possible_names:
-                n_name = self._normalize(name)
+            for n_name in normalized_names:
                 if n_name in header_to_indices:
                     # extend with all indices that exactly match this normalized name
                     indices_for_semantic.extend(header_to_indices[n_name])
 
             # Deduplicate while preserving order
             if indices_for_semantic:
-                seen = set()
-                deduped = [idx for idx in indices_for_semantic if not (idx in seen or seen.add(idx))]
-                column_map[semantic_name] = deduped
+                column_map[semantic_name] = list(dict.fromkeys(indices_for_semantic))
         
         return column_map
 
@@ -173,13 +483,16 @@ class MatchStatus(Enum):
     MANUAL = "manual"
     PENDING = "pending"
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Transaction:
     """Base transaction with shared fields."""
     date: datetime
     amount: float
     description: str
     reference: Optional[str] = None
+    # Proleptic ordinal of ``date`` (None if it has no date), so matchers can
+    # compare days as plain ints or NumPy arrays
+    epoch_days: Optional[int] = field(default=None, init=False, repr=False, compare=False)
         
     def __post_init__(self):
         """Validate transaction data after initialization"""
@@ -189,7 +502,18 @@ class Transaction:
         if not self.description or not self.description.strip():
             raise ValueError("Transaction description cannot be empty")
 
-@dataclass(kw_only=True)
+        toordinal = getattr(self.date, 'toordinal', None)
+        self.epoch_days = toordinal() if toordinal is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'date': self.date,
+            'amount': self.amount,
+            'description': self.description,
+            'reference': self.reference,
+        }
+
+@dataclass(kw_only=True, slots=True)
 class BankTransaction(Transaction):
     """Bank transaction with additional banking-specific fields"""
     id: str
@@ -199,7 +523,19 @@ class BankTransaction(Transaction):
     description_date: Optional[str] = None
     normalized_description: Optional[str] = None
 
-@dataclass(kw_only=True)
+    def to_dict(self) -> Dict[str, Any]:
+        data = Transaction.to_dict(self)
+        data.update({
+            'id': self.id,
+            'balance': self.balance,
+            'check_number': self.check_number,
+            'category': self.category,
+            'description_date': self.description_date,
+            'normalized_description': self.normalized_description,
+        })
+        return data
+
+@dataclass(kw_only=True, slots=True)
 class ERPTransaction(Transaction):
     """ERP transaction with additional ERP-specific fields"""
     id: str
@@ -209,8 +545,38 @@ class ERPTransaction(Transaction):
     description_date: Optional[str] = None
     normalized_description: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        data = Transaction.to_dict(self)
+        data.update({
+            'id': self.id,
+            'invoice_number': self.invoice_number,
+            'vendor_id': self.vendor_id,
+            'cheque_number': self.cheque_number,
+            'description_date': self.description_date,
+            'normalized_description': self.normalized_description,
+        })
+        return data
+
 
-@dataclass
+def date_difference_matrix(
+    bank_transactions: List[Transaction], erp_transactions: List[Transaction]
+) -> "np.ndarray":
+    """Absolute day gaps for every bank/ERP pair, shape ``(len(bank), len(erp))``.
+
+    Pairs where either side has no date are NaN.
+    """
+    if np is None:
+        raise ImportError("numpy is required for date_difference_matrix")
+
+    def _days(transactions):
+        return np.array(
+            [np.nan if t.epoch_days is None else t.epoch_days for t in transactions], dtype=float
+        )
+
+    return np.abs(_days(bank_transactions)[:, None] - _days(erp_transactions)[None, :])
+
+
+@dataclass(slots=True)
 class TransactionMatch:
     """Potential match between bank and ERP transactions."""
     bank_transaction: BankTransaction
@@ -224,6 +590,7 @@ class TransactionMatch:
     is_confirmed: bool = False
     reviewed_by: Optional[str] = None
     review_date: Optional[datetime] = None
+    reviewer_comment: Optional[str] = None
     status: MatchStatus = MatchStatus.PENDING    
 
     def __post_init__(self):
@@ -231,7 +598,57 @@ class TransactionMatch:
         if not (0 <= self.confidence_score <= 1):
             raise ValueError("Confidence score must be between 0 and 1")
 
-@dataclass
+    @classmethod
+    def build_unchecked(
+        cls,
+        bank_transaction: BankTransaction,
+        erp_transaction: ERPTransaction,
+        confidence_score: float,
+        amount_score: float,
+        date_score: float,
+        description_score: float,
+        match_note: Optional[str] = None,
+        status: MatchStatus = MatchStatus.PENDING,
+    ) -> "TransactionMatch":
+        """Create a match without running ``__post_init__`` validation.
+
+        For matcher inner loops where ``confidence_score`` is already known
+        to lie in ``[0, 1]``.
+        """
+        obj = object.__new__(cls)
+        obj.bank_transaction = bank_transaction
+        obj.erp_transaction = erp_transaction
+        obj.confidence_score = confidence_score
+        obj.amount_score = amount_score
+        obj.date_score = date_score
+        obj.description_score = description_score
+        obj.match_note = match_note
+        obj.match_reasons = []
+        obj.is_confirmed = False
+        obj.reviewed_by = None
+        obj.review_date = None
+        obj.reviewer_comment = None
+        obj.status = status
+        return obj
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'bank_transaction': self.bank_transaction.to_dict(),
+            'erp_transaction': self.erp_transaction.to_dict(),
+            'confidence_score': self.confidence_score,
+            'amount_score': self.amount_score,
+            'date_score': self.date_score,
+            'description_score': self.description_score,
+            'match_note': self.match_note,
+            'match_reasons': list(self.match_reasons),
+            'is_confirmed': self.is_confirmed,
+            'reviewed_by': self.reviewed_by,
+            'review_date': self.review_date,
+            'reviewer_comment': self.reviewer_comment,
+            'status': self.status,
+        }
+
+@dataclass(slots=True)
 class MatchResult:
     """Result of transaction matching process."""
     bank_transaction: TransactionData
@@ -241,8 +658,19 @@ class MatchResult:
     amount_difference: float = 0.0
     date_difference: int = 0
     description_similarity: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'bank_transaction': self.bank_transaction.to_dict(),
+            'erp_transaction': self.erp_transaction.to_dict() if self.erp_transaction else None,
+            'confidence_score': self.confidence_score,
+            'match_type': self.match_type,
+            'amount_difference': self.amount_difference,
+            'date_difference': self.date_difference,
+            'description_similarity': self.description_similarity,
+        }
     
-@dataclass
+@dataclass(slots=True)
 class ReconciliationResults:
     """Complete reconciliation report."""
     bank_statement: BankStatement
@@ -251,9 +679,20 @@ class ReconciliationResults:
     unmatched_bank: List[TransactionData]
     unmatched_erp: List[TransactionData]
     summary_stats: Dict[str, Any]
-    generated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    generated_at: str = field(default_factory=_now_iso)
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'bank_statement': self.bank_statement.to_dict(),
+            'erp_data': [t.to_dict() for t in self.erp_data],
+            'matches': [m.to_dict() for m in self.matches],
+            'unmatched_bank': [t.to_dict() for t in self.unmatched_bank],
+            'unmatched_erp': [t.to_dict() for t in self.unmatched_erp],
+            'summary_stats': self.summary_stats,
+            'generated_at': self.generated_at,
+        }
+
+@dataclass(slots=True)
 class ReconciliationReport:
     """Reconciliation results summary"""
     total_bank_transactions: int
@@ -266,6 +705,20 @@ class ReconciliationReport:
     matches: List[TransactionMatch] = field(default_factory=list)
     unmatched_bank: List[BankTransaction] = field(default_factory=list)
     unmatched_erp: List[ERPTransaction] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total_bank_transactions': self.total_bank_transactions,
+            'total_erp_transactions': self.total_erp_transactions,
+            'matched_count': self.matched_count,
+            'unmatched_bank_count': self.unmatched_bank_count,
+            'unmatched_erp_count': self.unmatched_erp_count,
+            'confidence_threshold': self.confidence_threshold,
+            'processing_time': self.processing_time,
+            'matches': [m.to_dict() for m in self.matches],
+            'unmatched_bank': [t.to_dict() for t in self.unmatched_bank],
+            'unmatched_erp': [t.to_dict() for t in self.unmatched_erp],
+        }
     
     @property
     def match_rate(self) -> float:
@@ -5,79 +5,150 @@
 Data persistence layer for templates and audit trails.
 """
 
+import copy
 import json
 import sqlite3
+import threading
 from pathlib import Path
-from typing import List, Optional
-from dataclasses import asdict
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 from .data_models import BankTemplate, ReconciliationReport
 import logging
 
+try:  # Optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _dumps(payload, indent: bool = False) -> str:
+    """Encode ``payload`` as JSON, in C via orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else None
+        return orjson.dumps(payload, option=option).decode("utf-8")
+    return json.dumps(payload, indent=2 if indent else None)
+
 class TemplateRepository:
-    """Repository for managing bank templates."""
+    """Repository for managing bank templates.
+
+    Templates live in a ``templates`` table of the audit database, one JSON
+    payload per ``bank_type``. They are kept in memory after the first read
+    and reloaded when another connection commits. Templates from the older
+    JSON file are imported the first time the table is empty.
+    """
     
-    def __init__(self, templates_file: str = "data/bank_templates.json"):
+    def __init__(
+        self,
+        templates_file: str = "data/bank_templates.json",
+        db_file: str = "data/audit.db",
+    ):
         self.templates_file = Path(templates_file)
-        self.templates_file.parent.mkdir(exist_ok=True)
-        self._ensure_file_exists()
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(exist_ok=True)
+        self._lock = threading.Lock()
+        self._cache: Optional[Dict[str, dict]] = None
+        self._data_version: Optional[int] = None
+        self._init_database()
     
-    def _ensure_file_exists(self):
-        """Create templates file if it doesn't exist."""
+    def _init_database(self):
+        """Open the connection, create the table and import legacy templates."""
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self._lock, self._conn as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS templates (
+                    bank_type TEXT PRIMARY KEY,
+                    payload BLOB,
+                    updated TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+            # Import once only; deleting every template must not bring the
+            # legacy file's templates back on the next start
+            imported = conn.execute(
+                "SELECT 1 FROM meta WHERE key = 'legacy_templates_imported'"
+            ).fetchone()
+            if imported is None:
+                legacy = self._read_legacy_file()
+                if legacy is not None:
+                    updated = datetime.now().isoformat()
+                    if conn.execute("SELECT 1 FROM templates LIMIT 1").fetchone() is None:
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO templates VALUES (?, ?, ?)",
+                            [(bank_type, _dumps(t), updated) for bank_type, t in legacy.items()],
+                        )
+                    conn.execute(
+                        "INSERT INTO meta VALUES ('legacy_templates_imported', ?)", (updated,)
+                    )
+
+    def _read_legacy_file(self) -> Optional[Dict[str, dict]]:
+        """Templates from the pre-SQLite JSON file, keyed by bank type.
+
+        ``None`` when the file exists but cannot be read, so the import is
+        retried on the next start.
+        """
         if not self.templates_file.exists():
-            self._save_templates([])
-    
-    def _load_templates(self) -> List[dict]:
-        """Load templates from file."""
+            return {}
         try:
             with open(self.templates_file, 'r') as f:
                 data = json.load(f)
-                return data.get('templates', [])
+            templates = data.get('templates', {})
+            if isinstance(templates, list):
+                legacy, templates = templates, {}
+                for t in legacy:
+                    templates.setdefault(t['bank_type'], t)
+            return templates
         except Exception as e:
-            logger.error(f"Failed to load templates: {e}")
-            return []
+            logger.error(f"Failed to import templates from {self.templates_file}: {e}")
+            return None
     
-    def _save_templates(self, templates: List[dict]):
-        """Save templates to file."""
+    def _load_templates(self) -> Dict[str, dict]:
+        """Load templates keyed by bank type, from memory while nothing else has written."""
         try:
-            data = {'templates': templates}
-            with open(self.templates_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._lock:
+                # data_version only changes when another connection commits
+                version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+                if self._cache is None or version != self._data_version:
+                    rows = self._conn.execute("SELECT bank_type, payload FROM templates").fetchall()
+                    self._cache = {bank_type: json.loads(payload) for bank_type, payload in rows}
+                    self._data_version = version
+                return self._cache
         except Exception as e:
-            logger.error(f"Failed to save templates: {e}")
+            logger.error(f"Failed to load templates: {e}")
+            return {}
     
     def get_all_templates(self) -> List[BankTemplate]:
         """Get all templates."""
-        template_dicts = self._load_templates()
-        return [BankTemplate(**t) for t in template_dicts]
+        # Copies, so editing a returned template's lists leaves the cache alone
+        return [BankTemplate(**copy.deepcopy(t)) for t in self._load_templates().values()]
     
     def get_template_by_type(self, bank_type: str) -> Optional[BankTemplate]:
         """Get template by bank type."""
-        templates = self.get_all_templates()
-        for template in templates:
-            if template.bank_type == bank_type:
-                return template
-        return None
+        template = self._load_templates().get(bank_type)
+        return BankTemplate(**copy.deepcopy(template)) if template is not None else None
     
     def save_template(self, template: BankTemplate) -> bool:
         """Save or update a template."""
         try:
-            templates = self._load_templates()
-            
-            # Find existing template or add new one
-            updated = False
-            for i, t in enumerate(templates):
-                if t['bank_type'] == template.bank_type:
-                    templates[i] = asdict(template)
-                    updated = True
-                    break
-            
-            if not updated:
-                templates.append(asdict(template))
-            
-            self._save_templates(templates)
+            payload = template.to_dict()
+            with self._lock, self._conn as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO templates VALUES (?, ?, ?)",
+                    (template.bank_type, _dumps(payload), datetime.now().isoformat()),
+                )
+                # Our own commits don't bump data_version, so patch the cache;
+                # to_dict() shares its lists with the caller's template
+                if self._cache is not None:
+                    self._cache[template.bank_type] = copy.deepcopy(payload)
             return True
         except Exception as e:
             logger.error(f"Failed to save template: {e}")
@@ -86,25 +157,41 @@ class TemplateRepository:
     def delete_template(self, bank_type: str) -> bool:
         """Delete a template."""
         try:
-            templates = self._load_templates()
-            templates = [t for t in templates if t['bank_type'] != bank_type]
-            self._save_templates(templates)
+            with self._lock, self._conn as conn:
+                conn.execute("DELETE FROM templates WHERE bank_type = ?", (bank_type,))
+                if self._cache is not None:
+                    self._cache.pop(bank_type, None)
             return True
         except Exception as e:
             logger.error(f"Failed to delete template: {e}")
             return False
 
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
 class AuditRepository:
     """Repository for audit trail and reconciliation history."""
     
     def __init__(self, db_file: str = "data/audit.db"):
         self.db_file = Path(db_file)
         self.db_file.parent.mkdir(exist_ok=True)
+        self._lock = threading.Lock()
         self._init_database()
     
     def _init_database(self):
-        """Initialize SQLite database."""
-        with sqlite3.connect(self.db_file) as conn:
+        """Open the shared connection and initialize the SQLite database."""
+        # One long-lived connection; WAL with synchronous=NORMAL avoids an
+        # fsync on every audit insert while staying crash-safe
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        # Rows addressable by column name without building a dict per row
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+
+        with self._lock, self._conn as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS reconciliation_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -116,6 +203,10 @@ class AuditRepository:
                     report_data TEXT
                 )
             """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_history_bank
+                ON reconciliation_history (bank_name, timestamp)
+            """)
             
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS user_actions (
@@ -129,40 +220,81 @@ class AuditRepository:
     
     def save_reconciliation(self, report: ReconciliationReport) -> bool:
         """Save reconciliation report."""
+        return self.save_reconciliations_bulk([report])
+
+    def save_reconciliations_bulk(self, reports: Iterable[ReconciliationReport]) -> bool:
+        """Save several reconciliation reports in one transaction."""
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                conn.execute("""
-                    INSERT INTO reconciliation_history 
-                    (timestamp, bank_name, total_transactions, matched_transactions, match_rate, report_data)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
+            # Serialize before taking the lock so other writers are not blocked
+            rows = [
+                (
                     report.generated_at,
                     report.bank_statement.bank_name,
                     len(report.bank_statement.transactions),
                     len(report.matches),
                     len(report.matches) / len(report.bank_statement.transactions) if report.bank_statement.transactions else 0,
-                    json.dumps(asdict(report))
-                ))
+                    _dumps(report.to_dict()),
+                )
+                for report in reports
+            ]
+            with self._lock, self._conn as conn:
+                conn.executemany("""
+                    INSERT INTO reconciliation_history 
+                    (timestamp, bank_name, total_transactions, matched_transactions, match_rate, report_data)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, rows)
             return True
         except Exception as e:
-            logger.error(f"Failed to save reconciliation: {e}")
+            logger.error(f"Failed to save reconciliations: {e}")
             return False
     
+    def get_reconciliation_history(
+        self, bank_name: Optional[str] = None, limit: int = 50
+    ) -> List[sqlite3.Row]:
+        """Most recent reconciliation summaries, optionally for one bank.
+
+        ``report_data`` is left out; rows are indexed by column name.
+        """
+        query = """
+            SELECT id, timestamp, bank_name, total_transactions,
+                   matched_transactions, match_rate
+            FROM reconciliation_history
+        """
+        params: Tuple = ()
+        if bank_name is not None:
+            query += " WHERE bank_name = ?"
+            params = (bank_name,)
+        query += " ORDER BY timestamp DESC LIMIT ?"
+        try:
+            with self._lock:
+                return self._conn.execute(query, params + (limit,)).fetchall()
+        except Exception as e:
+            logger.error(f"Failed to load reconciliation history: {e}")
+            return []
+
     def log_user_action(self, action_type: str, details: str, user_id: str = "default") -> bool:
         """Log user action for audit trail."""
+        return self.log_user_actions_bulk([(action_type, details, user_id)])
+
+    def log_user_actions_bulk(self, actions: Iterable[Tuple[str, str, str]]) -> bool:
+        """Log several ``(action_type, details, user_id)`` actions in one transaction."""
+        timestamp = datetime.now().isoformat()
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                conn.execute("""
+            with self._lock, self._conn as conn:
+                conn.executemany("""
                     INSERT INTO user_actions (timestamp, action_type, details, user_id)
                     VALUES (?, ?, ?, ?)
-                """, (
-                    datetime.now().isoformat(),
-                    action_type,
-                    details,
-                    user_id
-                ))
+                """, [
+                    (timestamp, action_type, details, user_id)
+                    for action_type, details, user_id in actions
+                ])
             return True
         except Exception as e:
-            logger.error(f"Failed to log user action: {e}")
+            logger.error(f"Failed to log user actions: {e}")
             return False
 
+    def close(self) -> None:
+        """Close the shared database connection."""
+        with self._lock:
+            self._conn.close()
+
@@ -13,13 +13,28 @@ Extends the existing data models with database connectivity.
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+from functools import lru_cache
 import logging
 import json
+import re
+import sys
 from pathlib import Path
 
+from .data_models import _now_iso
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# ``:name`` bind parameters referenced by a query
+_PARAM_RE = re.compile(r':(\w+)')
+_DESTRUCTIVE_SQL_RE = re.compile(r'delete|drop|truncate')
+# Table references following FROM/JOIN, optionally schema-qualified and quoted
+_SOURCE_TABLE_RE = re.compile(r'\b(?:from|join)\s+([\w$#."\[\]]+)', re.IGNORECASE)
+# Leading ``SELECT *`` that a template projection may narrow
+_SELECT_STAR_RE = re.compile(r'^\s*select\s+\*\s+(?=from\b)', re.IGNORECASE)
+# Plain or quoted, optionally qualified, column identifier
+_COLUMN_NAME_RE = re.compile(r'^[\w$#.]+$|^"[^"]+"$')
+
+@dataclass(slots=True)
 class DatabaseConnection:
     """ERP database connection configuration."""
     name: str
@@ -33,34 +48,81 @@ class DatabaseConnection:
     schema: Optional[str] = None
     connection_string: Optional[str] = None  # Custom connection string
     is_active: bool = True
-    created_date: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_date: str = field(default_factory=_now_iso)
     last_tested: Optional[str] = None
     test_result: Optional[str] = None
+
+    def __post_init__(self):
+        self.connection_type = sys.intern(self.connection_type)
     
     def get_connection_string(self) -> str:
         """Generate connection string based on database type."""
         if self.connection_string:
             return self.connection_string
-        
-        if self.connection_type == 'oracle':
-            if self.service_name:
-                return f"oracle+cx_oracle://{self.username}:{self.password}@{self.host}:{self.port}/?service_name={self.service_name}"
-            else:
-                return f"oracle+cx_oracle://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
-        
-        elif self.connection_type == 'sqlserver':
-            return f"mssql+pyodbc://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}?driver=ODBC+Driver+17+for+SQL+Server"
-        
-        elif self.connection_type == 'postgresql':
-            return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
-        
-        elif self.connection_type == 'mysql':
-            return f"mysql+pymysql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
-        
+
+        # Only the password-free parts are memoized, so secrets are never
+        # held by the cache and a rotated password takes effect immediately
+        prefix, suffix = _connection_string_parts(
+            self.connection_type, self.username, self.host,
+            self.port, self.database, self.service_name,
+        )
+        return f"{prefix}{self.password}{suffix}"
+
+
+@lru_cache(maxsize=64)
+def _connection_string_parts(
+    connection_type: str,
+    username: str,
+    host: str,
+    port: int,
+    database: str,
+    service_name: Optional[str],
+) -> Tuple[str, str]:
+    """URL text before and after the password for :meth:`DatabaseConnection.get_connection_string`.
+
+    Memoized on the connection fields, so edits to a connection still
+    produce a fresh URL.
+    """
+    if connection_type == 'oracle':
+        if service_name:
+            return f"oracle+oracledb://{username}:", f"@{host}:{port}/?service_name={service_name}"
         else:
-            raise ValueError(f"Unsupported database type: {self.connection_type}")
+            return f"oracle+oracledb://{username}:", f"@{host}:{port}/{database}"
+    
+    elif connection_type == 'sqlserver':
+        return f"mssql+pyodbc://{username}:", f"@{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server"
+    
+    elif connection_type == 'postgresql':
+        return f"postgresql://{username}:", f"@{host}:{port}/{database}"
+    
+    elif connection_type == 'mysql':
+        return f"mysql+pymysql://{username}:", f"@{host}:{port}/{database}"
+    
+    else:
+        raise ValueError(f"Unsupported database type: {connection_type}")
+
+def _accept(value: Any) -> None:
+    """Validator for types that take any value, such as ``string``."""
+
+
+def _strptime_validator(fmt: str):
+    def validate(value: Any) -> None:
+        # Non-string dates (e.g. ``datetime`` objects) are accepted as is
+        if isinstance(value, str):
+            datetime.strptime(value, fmt)
+    return validate
+
 
-@dataclass
+# Parameter data type -> callable raising ValueError/TypeError on bad input
+_VALIDATORS = {
+    'integer': int,
+    'decimal': float,
+    'date': _strptime_validator('%Y-%m-%d'),
+    'datetime': _strptime_validator('%Y-%m-%d %H:%M:%S'),
+}
+
+
+@dataclass(slots=True)
 class QueryParameter:
     """SQL query parameter definition."""
     name: str
@@ -79,22 +141,12 @@ class QueryParameter:
             return True, ""
         
         try:
-            if self.data_type == 'integer':
-                int(value)
-            elif self.data_type == 'decimal':
-                float(value)
-            elif self.data_type == 'date':
-                if isinstance(value, str):
-                    datetime.strptime(value, '%Y-%m-%d')
-            elif self.data_type == 'datetime':
-                if isinstance(value, str):
-                    datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
-            
+            _VALIDATORS.get(self.data_type, _accept)(value)
             return True, ""
         except (ValueError, TypeError) as e:
             return False, f"Invalid {self.data_type} value for '{self.name}': {str(e)}"
 
-@dataclass
+@dataclass(slots=True)
 class ERPQueryTemplate:
     """ERP database query template with parameters."""
     name: str
@@ -104,10 +156,12 @@ class ERPQueryTemplate:
     connection_name: str = ""
     expected_columns: List[str] = field(default_factory=list)  # Expected result columns
     created_by: str = "user"
-    created_date: str = field(default_factory=lambda: datetime.now().isoformat())
-    last_modified: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_date: str = field(default_factory=_now_iso)
+    last_modified: str = field(default_factory=_now_iso)
     is_active: bool = True
     category: str = "transactions"  # 'transactions', 'accounts', 'vendors', etc.
+    chunksize: int = 50_000  # Rows fetched per round trip when streaming results
+    projection: List[str] = field(default_factory=list)  # Columns to fetch instead of SELECT *
     
     def validate_query(self) -> Tuple[bool, List[str]]:
         """Validate SQL query syntax and parameters."""
@@ -118,13 +172,11 @@ class ERPQueryTemplate:
         if not query_lower.startswith('select'):
             errors.append("Query must be a SELECT statement")
         
-        if 'delete' in query_lower or 'drop' in query_lower or 'truncate' in query_lower:
+        if _DESTRUCTIVE_SQL_RE.search(query_lower):
             errors.append("Destructive SQL operations are not allowed")
         
         # Parameter validation
-        import re
-        param_pattern = r':(\w+)'
-        query_params = set(re.findall(param_pattern, self.sql_query))
+        query_params = set(_PARAM_RE.findall(self.sql_query))
         defined_params = set(p.name for p in self.parameters)
         
         missing_params = query_params - defined_params
@@ -134,10 +186,32 @@ class ERPQueryTemplate:
         unused_params = defined_params - query_params
         if unused_params:
             errors.append(f"Unused parameters defined: {', '.join(unused_params)}")
+
+        bad_columns = [c for c in self.projection if not _COLUMN_NAME_RE.match(c)]
+        if bad_columns:
+            errors.append(f"Invalid projection columns: {', '.join(bad_columns)}")
         
         return len(errors) == 0, errors
 
-@dataclass
+    def projected_sql(self) -> str:
+        """``sql_query`` with a leading ``SELECT *`` narrowed to ``projection``.
+
+        Queries that already list their columns are returned unchanged.
+        """
+        if not self.projection:
+            return self.sql_query
+        return _SELECT_STAR_RE.sub(
+            lambda m: f"SELECT {', '.join(self.projection)} ", self.sql_query, count=1
+        )
+
+    def source_tables(self) -> frozenset:
+        """Lower-cased names of the tables the query reads from."""
+        return frozenset(
+            name.strip('"[]').lower()
+            for name in _SOURCE_TABLE_RE.findall(self.sql_query)
+        )
+
+@dataclass(slots=True)
 class ERPQueryExecution:
     """Record of ERP query execution."""
     query_name: str
@@ -10,37 +10,159 @@ ERP database service for executing queries and managing connections.
 import pandas as pd
 import sqlalchemy as sa
 from sqlalchemy import create_engine, text
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+import asyncio
 import hashlib
+import json
+import os
+import threading
 import time
 import logging
-import json
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+try:  # Optional dependency
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except Exception:  # pragma: no cover - optional
+    pa = None
+    pq = None
 
 logger = logging.getLogger(__name__)
 
 from .database_models import DatabaseConnection, ERPQueryTemplate, ERPQueryExecution, QueryParameter
-from .data_models import TransactionData
-from .text_utils import normalize_description
+from .data_models import TransactionData, TransactionFrame
+from .text_utils import normalize_descriptions
+
+# Pooled connections kept per engine; also the fan-out width of execute_many
+_ENGINE_POOL_SIZE = 8
+
+# Leading byte of every cache key hash; bump when the key layout changes so
+# disk cache entries written under the old layout can never be hit
+_CACHE_KEY_VERSION = b"\x02"
+
+# Most recent ERPQueryExecution records kept by a service; older ones are dropped
+_EXECUTION_LOG_SIZE = 1000
+
+# Parquet schema metadata key holding a disk cache entry's invalidation tags
+_DISK_CACHE_TAGS = b"erp_cache_tags"
+
+
+@lru_cache(maxsize=1024)
+def _compiled_text(sql: str) -> sa.TextClause:
+    """``text(sql)``, parsed once per distinct SQL string.
+
+    TextClause is immutable (``bindparams`` returns a copy), so the cached
+    object can be shared between threads.
+    """
+    return text(sql)
+
+
+class BoundedDFCache:
+    """LRU cache of query result DataFrames, capped by entry count and bytes.
+
+    Each entry carries a set of tags (source table names, plus the template
+    and connection it came from) so related results can be invalidated
+    without flushing the whole cache. Safe to share between threads.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 2 << 30):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[pd.DataFrame, int, frozenset]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Cached DataFrame for ``key``, marking it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, df: pd.DataFrame, tags: frozenset = frozenset()) -> None:
+        """Cache ``df``, evicting least recently used entries to stay within both caps."""
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            self._discard(key)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (df, nbytes, tags)
+            self._bytes += nbytes
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+
+    def invalidate(self, tags) -> int:
+        """Drop every entry sharing a tag with ``tags``; returns how many."""
+        tags = frozenset(tags)
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[2] & tags]
+            for key in stale:
+                self._discard(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
 
 class ERPDatabaseService:
     """Service for ERP database operations."""
     
-    def __init__(self):
+    def __init__(self, disk_cache_dir: Optional[str] = None, disk_cache_ttl: float = 3600.0):
+        """
+        Args:
+            disk_cache_dir: Directory for Parquet copies of query results,
+                shared by every process pointing at it. Disabled when None.
+            disk_cache_ttl: Seconds a disk cached result stays valid.
+        """
         self.connections: Dict[str, DatabaseConnection] = {}
         self.query_templates: Dict[str, ERPQueryTemplate] = {}
-        self.execution_cache: Dict[str, pd.DataFrame] = {}  # Simple caching
+        self.execution_cache = BoundedDFCache()
+        # Recent executions, oldest first; deque appends are thread-safe and
+        # never block, the oldest record is dropped once full
+        self.execution_log: "deque[ERPQueryExecution]" = deque(maxlen=_EXECUTION_LOG_SIZE)
         self._engines: Dict[str, sa.Engine] = {}
+        # Guards creating and replacing entries in ``_engines``
+        self._engine_lock = threading.Lock()
+        # Template name -> (sql it was built from, bound TextClause)
+        self._compiled_queries: Dict[str, Tuple[str, sa.TextClause]] = {}
+        self._disk_cache_dir = Path(disk_cache_dir) if disk_cache_dir and pq is not None else None
+        self._disk_cache_ttl = disk_cache_ttl
+        if self._disk_cache_dir is not None:
+            self._disk_cache_dir.mkdir(parents=True, exist_ok=True)
     
     def add_connection(self, connection: DatabaseConnection) -> bool:
         """Add or update database connection."""
         try:
+            previous = self.connections.get(connection.name)
             self.connections[connection.name] = connection
+            # Registering a known connection (e.g. at startup) keeps its results
+            if previous is not None and previous != connection:
+                self._invalidate({f"connection:{connection.name}"})
             # Clear cached engine if it exists
-            if connection.name in self._engines:
-                self._engines[connection.name].dispose()
-                del self._engines[connection.name]
+            with self._engine_lock:
+                engine = self._engines.pop(connection.name, None)
+            if engine is not None:
+                engine.dispose()
             return True
         except Exception as e:
             logger.error(f"Failed to add connection {connection.name}: {e}")
@@ -55,10 +177,14 @@ class ERPDatabaseService:
             
             engine = self._get_engine(connection)
             
-            # Test with simple query
+            # Ping natively where the driver can (oracledb round-trips without
+            # parsing SQL); otherwise the dialect's own test query
             with engine.connect() as conn:
-                result = conn.execute(text("SELECT 1 FROM DUAL"))  # Oracle syntax
-                result.fetchone()
+                ping = getattr(conn.connection.driver_connection, "ping", None)
+                if ping is not None:
+                    ping()
+                else:
+                    engine.dialect.do_ping(conn.connection.dbapi_connection)
             
             # Update connection test result
             connection.last_tested = datetime.now().isoformat()
@@ -77,13 +203,24 @@ class ERPDatabaseService:
     
     def _get_engine(self, connection: DatabaseConnection) -> sa.Engine:
         """Get or create database engine."""
-        if connection.name not in self._engines:
+        engine = self._engines.get(connection.name)
+        if engine is not None:
+            return engine
+
+        with self._engine_lock:
+            # Another thread may have created it while we waited
+            engine = self._engines.get(connection.name)
+            if engine is not None:
+                return engine
+
             connection_string = connection.get_connection_string()
             
             # Configure engine based on database type
             engine_kwargs = {
                 'echo': False,  # Set to True for SQL debugging
                 'pool_pre_ping': True,  # Verify connections before use
+                'pool_size': _ENGINE_POOL_SIZE,  # Warm connections reused across queries
+                'pool_use_lifo': True,  # Reuse the most recently returned connection
                 'pool_recycle': 3600,   # Recycle connections every hour
             }
             
@@ -92,13 +229,18 @@ class ERPDatabaseService:
                     'max_identifier_length': 30,  # Oracle limitation
                 })
             
-            self._engines[connection.name] = create_engine(connection_string, **engine_kwargs)
-        
-        return self._engines[connection.name]
+            engine = self._engines[connection.name] = create_engine(connection_string, **engine_kwargs)
+            return engine
     
     @contextmanager
     def get_connection(self, connection_name: str):
-        """Context manager for database connections."""
+        """Context manager for database connections.
+
+        Every call checks out its own pooled connection, so this is safe to
+        use from several threads at once. Don't pass the connection or its
+        results to another thread; templates and connection configs are fine
+        to share.
+        """
         connection = self.connections.get(connection_name)
         if not connection:
             raise ValueError(f"Connection '{connection_name}' not found")
@@ -121,7 +263,12 @@ class ERPDatabaseService:
                 return False
             
             template.last_modified = datetime.now().isoformat()
+            previous = self.query_templates.get(template.name)
             self.query_templates[template.name] = template
+            self._compiled_queries.pop(template.name, None)
+            self._compiled_query(template)
+            if previous is not None and previous.projected_sql() != template.projected_sql():
+                self._invalidate({f"template:{template.name}"})
             return True
             
         except Exception as e:
@@ -144,26 +291,43 @@ class ERPDatabaseService:
                 return False, pd.DataFrame(), validation_error
             
             # Check cache
-            cache_key = self._generate_cache_key(template_name, parameters)
-            if cache_key in self.execution_cache:
+            cache_key = self._generate_cache_key(template, parameters)
+            cached = self.execution_cache.get(cache_key)
+            if cached is not None:
                 logger.info(f"Returning cached result for {template_name}")
-                return True, self.execution_cache[cache_key], "Cached result"
-            
+                return True, cached, "Cached result"
+
+            cache_tags = template.source_tables() | {
+                f"template:{template_name}",
+                f"connection:{template.connection_name}",
+            }
+            cached = self._read_disk_cache(cache_key)
+            if cached is not None:
+                logger.info(f"Returning disk cached result for {template_name}")
+                self.execution_cache.put(cache_key, cached, cache_tags)
+                return True, cached, "Cached result"
+
             # Execute query
             with self.get_connection(template.connection_name) as conn:
-                # Replace parameters in query
-                query = text(template.sql_query)
-                result = conn.execute(query, parameters)
-                
-                # Convert to DataFrame
-                df = pd.DataFrame(result.fetchall(), columns=result.keys())
+                df = self._fetch_arrow_frame(conn, template, parameters)
+                if df is None:
+                    columns, chunks = self._stream_frames(
+                        conn, self._compiled_query(template), parameters, template.chunksize
+                    )
+                    frames = list(chunks)
+                    df = (
+                        pd.concat(frames, ignore_index=True, copy=False)
+                        if frames else pd.DataFrame(columns=columns)
+                    )
+                    df = self._typed_frame(df)
                 
                 # Cache result
-                self.execution_cache[cache_key] = df
+                self.execution_cache.put(cache_key, df, cache_tags)
+                self._write_disk_cache(cache_key, df, cache_tags)
                 
                 # Log execution
                 execution_time = time.time() - start_time
-                execution = ERPQueryExecution(
+                self.execution_log.append(ERPQueryExecution(
                     query_name=template_name,
                     connection_name=template.connection_name,
                     parameters=parameters,
@@ -171,7 +335,7 @@ class ERPDatabaseService:
                     execution_duration=execution_time,
                     success=True,
                     result_hash=cache_key
-                )
+                ))
                 
                 logger.info(f"Query {template_name} executed successfully: {len(df)} rows in {execution_time:.2f}s")
                 return True, df, f"Retrieved {len(df)} records"
@@ -181,17 +345,139 @@ class ERPDatabaseService:
             logger.error(f"Query {template_name} failed: {e}")
             
             # Log failed execution
-            execution = ERPQueryExecution(
+            self.execution_log.append(ERPQueryExecution(
                 query_name=template_name,
                 connection_name=template.connection_name if template else "",
                 parameters=parameters,
                 execution_duration=time.time() - start_time,
                 success=False,
                 error_message=error_msg
-            )
+            ))
             
             return False, pd.DataFrame(), error_msg
     
+    def execute_many(
+        self, requests: List[Tuple[str, Dict[str, Any]]], max_workers: int = _ENGINE_POOL_SIZE
+    ) -> List[Tuple[bool, pd.DataFrame, str]]:
+        """Run independent ``(template_name, parameters)`` queries concurrently.
+
+        Results come back in request order, each as :meth:`execute_query`
+        would return it. Threads are enough since DB drivers release the GIL
+        while waiting on the server.
+        """
+        # Create engines up front rather than from several threads at once
+        names = {
+            self.query_templates[name].connection_name
+            for name, _ in requests if name in self.query_templates
+        }
+        for name in names:
+            try:
+                if name in self.connections:
+                    self._get_engine(self.connections[name])
+            except Exception as e:
+                # execute_query reports the failure for each affected request
+                logger.warning(f"Failed to create engine for {name}: {e}")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda request: self.execute_query(*request), requests))
+
+    async def execute_query_async(
+        self, template_name: str, parameters: Dict[str, Any]
+    ) -> Tuple[bool, pd.DataFrame, str]:
+        """Awaitable :meth:`execute_query`.
+
+        Runs the blocking query in a worker thread, so several templates can
+        be awaited together with ``asyncio.gather``; each draws its own
+        connection from the engine pool.
+        """
+        return await asyncio.to_thread(self.execute_query, template_name, parameters)
+
+    def execute_query_iter(self, template_name: str, parameters: Dict[str, Any]) -> Iterator[pd.DataFrame]:
+        """Execute ERP query, yielding the result in ``template.chunksize`` row chunks.
+
+        Unlike :meth:`execute_query` results are neither cached nor held in
+        memory as a whole. Raises ``ValueError`` for an unknown template or
+        invalid parameters.
+        """
+        template = self.query_templates.get(template_name)
+        if not template:
+            raise ValueError(f"Query template '{template_name}' not found")
+
+        validation_error = self._validate_parameters(template, parameters)
+        if validation_error:
+            raise ValueError(validation_error)
+
+        with self.get_connection(template.connection_name) as conn:
+            _, chunks = self._stream_frames(conn, self._compiled_query(template), parameters, template.chunksize)
+            yield from chunks
+
+    @staticmethod
+    def _stream_frames(conn, query: sa.TextClause, parameters: Dict[str, Any], chunksize: int):
+        """Run ``query`` on a server-side cursor.
+
+        Returns the result column names and a generator of DataFrames, one per
+        ``chunksize`` rows, so the full row list is never buffered.
+        """
+        conn = conn.execution_options(stream_results=True, yield_per=chunksize)
+        result = conn.execute(query, parameters)
+        columns = list(result.keys())
+        chunks = (pd.DataFrame(rows, columns=columns) for rows in result.partitions(chunksize))
+        return columns, chunks
+
+    @staticmethod
+    def _typed_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Replace inferred ``object`` columns with Arrow-backed dtypes.
+
+        DBAPI rows give pandas no column types, so strings, nullable integers
+        and timestamps otherwise land in ``object`` columns of boxed Python
+        values. Arrow dtypes hold them natively, like :meth:`_fetch_arrow_frame`
+        results. Done once on the whole result so every chunk agrees;
+        ``Decimal`` and other unsupported values stay ``object``.
+        """
+        if pa is None or df.empty:
+            return df
+        return df.convert_dtypes(dtype_backend="pyarrow")
+
+    @staticmethod
+    def _fetch_arrow_frame(
+        conn, template: ERPQueryTemplate, parameters: Dict[str, Any]
+    ) -> Optional[pd.DataFrame]:
+        """Fetch through python-oracledb's Arrow interface, when available.
+
+        ``fetch_df_all`` (oracledb 3.0+) builds Arrow columns in the driver,
+        so no Python object is created per cell. Returns ``None`` when the
+        connection isn't oracledb or pyarrow is missing.
+        """
+        if pa is None:
+            return None
+        raw = conn.connection.driver_connection
+        if not hasattr(raw, "fetch_df_all"):
+            return None
+        odf = raw.fetch_df_all(
+            statement=template.projected_sql(), parameters=parameters, arraysize=template.chunksize
+        )
+        table = pa.Table.from_arrays(odf.column_arrays(), names=odf.column_names())
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        # Match SQLAlchemy, which reports case-insensitive Oracle names in lower case
+        df.columns = [name.lower() if name.isupper() else name for name in df.columns]
+        return df
+
+    def _compiled_query(self, template: ERPQueryTemplate) -> sa.TextClause:
+        """``template.projected_sql()`` as a ``TextClause`` with its parameters bound.
+
+        Built once per template and reused while the SQL is unchanged; bound
+        values are always sent to the driver as parameters.
+        """
+        sql = template.projected_sql()
+        cached = self._compiled_queries.get(template.name)
+        if cached is not None and cached[0] == sql:
+            return cached[1]
+        query = _compiled_text(sql).bindparams(
+            *(sa.bindparam(p.name) for p in template.parameters)
+        )
+        self._compiled_queries[template.name] = (sql, query)
+        return query
+
     def _validate_parameters(self, template: ERPQueryTemplate, parameters: Dict[str, Any]) -> Optional[str]:
         """Validate query parameters."""
         for param in template.parameters:
@@ -201,16 +487,52 @@ class ERPDatabaseService:
                 return error_msg
         return None
     
-    def _generate_cache_key(self, template_name: str, parameters: Dict[str, Any]) -> str:
-        """Generate cache key for query results."""
-        param_str = json.dumps(parameters, sort_keys=True, default=str)
-        key_data = f"{template_name}:{param_str}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+    def _generate_cache_key(self, template: ERPQueryTemplate, parameters: Dict[str, Any]) -> str:
+        """Generate cache key for query results.
+
+        The key covers the SQL actually run and the database it runs on, so
+        disk cache entries shared with other processes, or left from before
+        a template or connection edit, are never served for another query.
+
+        Parameters are hashed in name order, so the key doesn't depend on
+        dict ordering; NUL separators keep name/value boundaries unambiguous.
+        Values are hashed by ``repr``, which keeps their type (``1`` and
+        ``'1'`` differ); sets are sorted first since their order isn't stable.
+        """
+        connection = self.connections.get(template.connection_name)
+        target = (
+            connection.connection_type, connection.host, connection.port,
+            connection.database, connection.service_name, connection.username,
+            connection.connection_string,
+        ) if connection is not None else None
+        h = hashlib.blake2b(_CACHE_KEY_VERSION, digest_size=16)
+        for part in (template.name, template.connection_name, repr(target), template.projected_sql()):
+            h.update(part.encode() + b"\0")
+        for name in sorted(parameters):
+            value = parameters[name]
+            if isinstance(value, (set, frozenset)):
+                value = sorted(value, key=repr)
+            h.update(b"\0" + name.encode() + b"\0" + repr(value).encode())
+        return h.hexdigest()
     
     def convert_to_transactions(self, df: pd.DataFrame, column_mapping: Dict[str, str]) -> List[TransactionData]:
-        """Convert ERP query results to TransactionData objects."""
-        transactions = []
-        
+        """Convert ERP query results to TransactionData objects.
+
+        Columns are converted whole rather than row by row; rows without a
+        usable date, description or amount are skipped.
+        """
+        return TransactionData.from_dataframe(self._transaction_columns(df, column_mapping))
+
+    def convert_to_transaction_frame(self, df: pd.DataFrame, column_mapping: Dict[str, str]) -> TransactionFrame:
+        """Like :meth:`convert_to_transactions`, but as column arrays.
+
+        No per-row objects are created; iterating the frame yields
+        ``TransactionData`` lazily for callers that need them.
+        """
+        return TransactionFrame.from_dataframe(self._transaction_columns(df, column_mapping))
+
+    def _transaction_columns(self, df: pd.DataFrame, column_mapping: Dict[str, str]) -> pd.DataFrame:
+        """Valid rows of ``df`` as date/description/amount/reference/normalized_description."""
         # Default column mapping
         default_mapping = {
             'date': 'date',
@@ -222,33 +544,45 @@ class ERPDatabaseService:
         # Use provided mapping or defaults
         mapping = {**default_mapping, **column_mapping}
         
-        def _build_transaction(row: Dict[str, Any]) -> Optional[TransactionData]:
-            try:
-                date_str = str(row.get(mapping['date'], ''))
-                description = str(row.get(mapping['description'], ''))
-                amount = float(row.get(mapping['amount'], 0.0))
-                reference = (
-                    str(row.get(mapping['reference']))
-                    if mapping['reference'] in row and pd.notna(row.get(mapping['reference']))
-                    else None
-                )
-
-                normalized_description = normalize_description(description, date_str)
-                return TransactionData(
-                    date=date_str,
-                    description=description,
-                    amount=amount,
-                    reference=reference,
-                    normalized_description=normalized_description,
-                )
-                
-            except Exception as e:
-                logger.warning(f"Failed to convert row to transaction: {e}")
-                return None
-        
-        transactions = list(filter(None, (_build_transaction(row) for row in df.to_dict('records'))))
-        
-        return transactions
+        def _text(name: str) -> pd.Series:
+            # str() of each value, as the per-row conversion did; a missing
+            # column or value reads as '' and fails validation. Nulls are
+            # blanked before str() since Arrow-backed columns hold pd.NA,
+            # which stringifies as '<NA>' rather than 'nan'
+            if name not in df.columns:
+                return pd.Series('', index=df.index, dtype=object)
+            column = df[name]
+            return column.astype(object).map(str).where(column.notna(), '')
+
+        dates = _text(mapping['date'])
+        descriptions = _text(mapping['description'])
+        if mapping['amount'] in df.columns:
+            # float64 whatever the source dtype, so Arrow nulls become NaN
+            amounts = pd.to_numeric(df[mapping['amount']], errors='coerce').astype('float64')
+        else:
+            amounts = pd.Series(0.0, index=df.index)
+        if mapping['reference'] in df.columns:
+            references = df[mapping['reference']].astype(object)
+            references = references.map(str).where(references.notna(), None)
+        else:
+            references = pd.Series(None, index=df.index, dtype=object)
+
+        def _blank(column: pd.Series) -> pd.Series:
+            return column.str.lower().isin(['nan', 'none', ''])
+
+        valid = ~(_blank(dates) | _blank(descriptions) | amounts.isna())
+        skipped = int((~valid).sum())
+        if skipped:
+            logger.warning(f"Skipped {skipped} ERP rows with a missing date, description or amount")
+
+        frame = pd.DataFrame({
+            'date': dates[valid],
+            'description': descriptions[valid],
+            'amount': amounts[valid],
+            'reference': references[valid],
+        })
+        frame['normalized_description'] = normalize_descriptions(frame['description'])
+        return frame
     
     def get_available_connections(self) -> List[DatabaseConnection]:
         """Get list of available database connections."""
@@ -266,4 +600,65 @@ class ERPDatabaseService:
     def clear_cache(self):
         """Clear query result cache."""
         self.execution_cache.clear()
-        logger.info("Query cache cleared")
\ No newline at end of file
+        for path in self._disk_cache_files():
+            path.unlink(missing_ok=True)
+        logger.info("Query cache cleared")
+
+    def _invalidate(self, tags) -> int:
+        """Drop memory and disk cached results sharing a tag with ``tags``."""
+        tags = frozenset(tags)
+        removed = self.execution_cache.invalidate(tags)
+        for path in self._disk_cache_files():
+            try:
+                metadata = pq.read_schema(path).metadata or {}
+                if tags & set(json.loads(metadata.get(_DISK_CACHE_TAGS, b"[]"))):
+                    path.unlink(missing_ok=True)
+            except Exception as e:
+                logger.warning(f"Failed to check disk cache entry {path.name}: {e}")
+        return removed
+
+    def _disk_cache_files(self) -> List[Path]:
+        if self._disk_cache_dir is None:
+            return []
+        return list(self._disk_cache_dir.glob("*.parquet"))
+
+    def _read_disk_cache(self, cache_key: str) -> Optional[pd.DataFrame]:
+        """Result cached on disk for ``cache_key``, removing it once expired."""
+        if self._disk_cache_dir is None:
+            return None
+        path = self._disk_cache_dir / f"{cache_key}.parquet"
+        try:
+            if time.time() - path.stat().st_mtime > self._disk_cache_ttl:
+                path.unlink(missing_ok=True)
+                return None
+            return pq.read_table(path, memory_map=True).to_pandas()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read disk cache entry {path.name}: {e}")
+            return None
+
+    def _write_disk_cache(self, cache_key: str, df: pd.DataFrame, tags: frozenset) -> None:
+        """Write ``df`` to the disk cache; results Arrow can't represent are skipped."""
+        if self._disk_cache_dir is None:
+            return
+        path = self._disk_cache_dir / f"{cache_key}.parquet"
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[_DISK_CACHE_TAGS] = json.dumps(sorted(tags)).encode()
+            table = table.replace_schema_metadata(metadata)
+            pq.write_table(table, tmp, compression="zstd", row_group_size=64_000)
+            # Readers in other processes never see a partially written file
+            os.replace(tmp, path)
+        except Exception as e:
+            tmp.unlink(missing_ok=True)
+            logger.warning(f"Failed to write disk cache entry for {cache_key}: {e}")
+
+    def invalidate_tables(self, tables) -> int:
+        """Drop cached results of queries reading any of ``tables``."""
+        removed = self._invalidate({t.lower() for t in tables})
+        if removed:
+            logger.info(f"Invalidated {removed} cached results for tables {sorted(tables)}")
+        return removed
\ No newline at end of file
@@ -9,8 +9,11 @@
 Enhanced ERP file processor with auto-mapping and data cleaning capabilities.
 """
 
+import re
+
 import pandas as pd
 import numpy as np
+from pandas.io.parsers import TextParser
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
@@ -23,6 +26,38 @@ from .base_file_processor import BaseFileProcessor
 
 logger = logging.getLogger(__name__)
 
+
+def _excel_cell(value: Any) -> Any:
+    """Undo ``header=None`` column typing the way pandas' Excel readers see cells."""
+    if isinstance(value, float):
+        if value != value:
+            return ''
+        if value.is_integer():
+            return int(value)
+    return value
+
+
+def _frame_with_header(raw: pd.DataFrame, header_row: int) -> pd.DataFrame:
+    """``raw`` (read with ``header=None``) as if read with ``header=header_row``.
+
+    Runs the rows back through the parser ``read_excel`` uses, so column
+    names (``Unnamed: n``, ``.1`` suffixes) and dtypes match a fresh read
+    without parsing the workbook again.
+    """
+    rows = [[_excel_cell(v) for v in row] for row in raw.to_numpy(dtype=object).tolist()]
+    return TextParser(rows, header=header_row).read()
+
+# Descriptions marking total/summary rows rather than transactions
+_TOTAL_ROW_RE = re.compile(
+    r'total|summary|balance brought forward|carried forward|opening balance|closing balance',
+    re.IGNORECASE,
+)
+
+# Lower-cased column names holding money in or out; 'credit'/'debit' also
+# cover their plurals
+_CREDITS_COLUMN_RE = re.compile(r'credit|receipts|deposits|inflow')
+_DEBITS_COLUMN_RE = re.compile(r'debit|payments|withdrawals|outflow')
+
 class ERPFileProcessor(BaseFileProcessor):
     """Enhanced ERP file processor for complex bank statements and ERP files."""
     
@@ -54,6 +89,13 @@ class ERPFileProcessor(BaseFileProcessor):
             'bank_ref', 'customer_ref', 'doc_number', 'voucher_number',
             'additional_details', 'memo2', 'notes', 'comments'
         ]
+
+        # Per field: the exact column names, and one alternation regex that
+        # replaces testing each pattern as a substring in turn
+        self._field_matchers = {
+            field_type: (frozenset(patterns), re.compile('|'.join(map(re.escape, patterns))))
+            for field_type, patterns in self.column_patterns.items()
+        }
     
     def analyze_and_process_file(
         self, file_path: str, sheet_name: Optional[str] = None
@@ -118,11 +160,12 @@ class ERPFileProcessor(BaseFileProcessor):
     def _analyze_csv_structure(self, file_path: str) -> Dict[str, Any]:
         """Analyze CSV file structure."""
         try:
-            # Read first few rows to detect structure
-            sample_df = self.read_file(file_path, nrows=10, header=0)
+            # Read the whole file: nrows would force the slower C engine, and
+            # this is the read_file call processing makes, so it is then cached
+            df = self.read_file(file_path, header=0)
             
             # Assume first row is headers for CSV
-            columns = sample_df.columns.tolist()
+            columns = df.columns.tolist()
             
             # Generate mapping
             mapping = self._generate_enhanced_column_mapping(columns)
@@ -136,7 +179,7 @@ class ERPFileProcessor(BaseFileProcessor):
                 'confidence': self._calculate_mapping_confidence(mapping),
                 'metadata': {
                     'file_type': 'csv',
-                    'total_rows': len(sample_df),
+                    'total_rows': len(df),
                     'data_start_row': 1
                 }
             }
@@ -151,19 +194,16 @@ class ERPFileProcessor(BaseFileProcessor):
                                 sheet_name: Optional[str] = None) -> Dict[str, Any]:
         """Analyze Excel file structure - handles complex layouts like Lloyds."""
         try:
-            # Read Excel file to find structure
-            xl_file = pd.ExcelFile(file_path)
-            
             if sheet_name is None:
-                sheet_name = xl_file.sheet_names[0]  # Use first sheet
+                with pd.ExcelFile(file_path) as xl_file:
+                    sheet_name = xl_file.sheet_names[0]  # Use first sheet
             
-            # Read first 20 rows to find header structure
-            sample_df = self.read_file(
-                file_path, sheet_name=sheet_name, header=None, nrows=20
-            )
+            # Parse the sheet once; the header is located in the first 20 rows
+            # and _process_data_with_mapping gets the same read from the cache
+            raw_df = self.read_file(file_path, sheet_name=sheet_name, header=None)
             
             # Find the header row (row with most text values)
-            header_row_idx = self.find_header_row(sample_df)
+            header_row_idx = self.find_header_row(raw_df.head(20))
             
             if header_row_idx is None:
                 return {
@@ -171,27 +211,25 @@ class ERPFileProcessor(BaseFileProcessor):
                     'error': 'Could not identify header row in Excel file'
                 }
             
-            # Read file with correct header
-            full_df = self.read_file(
-                file_path, sheet_name=sheet_name, header=header_row_idx
-            )
+            # Column names need only the rows up to the header
+            columns = _frame_with_header(raw_df.iloc[:header_row_idx + 1], header_row_idx).columns.tolist()
             
             # Generate enhanced column mapping
-            mapping = self._generate_enhanced_column_mapping(full_df.columns.tolist())
+            mapping = self._generate_enhanced_column_mapping(columns)
             
             return {
                 'success': True,
                 'file_type': 'excel',
                 'sheet_name': sheet_name,
                 'header_row': header_row_idx,
-                'columns': full_df.columns.tolist(),
+                'columns': columns,
                 'mapping': mapping,
                 'confidence': self._calculate_mapping_confidence(mapping),
                 'metadata': {
                     'file_type': 'excel',
                     'sheet_name': sheet_name,
                     'header_row': header_row_idx,
-                    'total_rows': len(full_df),
+                    'total_rows': len(raw_df) - header_row_idx - 1,
                     'data_start_row': header_row_idx + 1
                 }
             }
@@ -227,17 +265,16 @@ class ERPFileProcessor(BaseFileProcessor):
         
         # Single column mappings for date and reference
         for field_type in ['date', 'reference']:
-            patterns = self.column_patterns[field_type]
+            exact_names, pattern_re = self._field_matchers[field_type]
             best_match_idx = None
-            best_match_score = 0
             
+            # The first exact name wins, else the first column containing a pattern
             for i, col_name in enumerate(lower_columns):
-                for pattern in patterns:
-                    if pattern in col_name:
-                        score = 2 if pattern == col_name else 1
-                        if score > best_match_score:
-                            best_match_score = score
-                            best_match_idx = i
+                if col_name in exact_names:
+                    best_match_idx = i
+                    break
+                if best_match_idx is None and pattern_re.search(col_name):
+                    best_match_idx = i
             
             mapping[field_type] = best_match_idx
         
@@ -338,13 +375,10 @@ class ERPFileProcessor(BaseFileProcessor):
         credits_idx = None
         debits_idx = None
         
-        credits_patterns = ['credits', 'credit', 'receipts', 'deposits', 'inflow']
-        debits_patterns = ['debits', 'debit', 'payments', 'withdrawals', 'outflow']
-        
         for i, col_name in enumerate(lower_columns):
-            if any(pattern in col_name for pattern in credits_patterns):
+            if _CREDITS_COLUMN_RE.search(col_name):
                 credits_idx = i
-            elif any(pattern in col_name for pattern in debits_patterns):
+            elif _DEBITS_COLUMN_RE.search(col_name):
                 debits_idx = i
         
         # If we found both credits and debits columns
@@ -356,7 +390,7 @@ class ERPFileProcessor(BaseFileProcessor):
                 'debits_column': debits_idx,
                 'credits_name': original_columns[credits_idx],
                 'debits_name': original_columns[debits_idx],
-                'method': 'method'  # Credits positive, Debits negative
+                'method': method
             }
         
         # If we found only credits column
@@ -422,8 +456,11 @@ class ERPFileProcessor(BaseFileProcessor):
             }
 
             if metadata['file_type'] == 'excel':
-                read_kwargs['sheet_name'] = metadata.get('sheet_name')
-            df = self.read_file(file_path, **read_kwargs)
+                # Same read as _analyze_excel_structure, so served from cache
+                raw_df = self.read_file(file_path, sheet_name=metadata.get('sheet_name'), header=None)
+                df = _frame_with_header(raw_df, read_kwargs['header'])
+            else:
+                df = self.read_file(file_path, **read_kwargs)
             
             # Create result DataFrame with mapped columns
             result_df = pd.DataFrame()
@@ -470,37 +507,16 @@ class ERPFileProcessor(BaseFileProcessor):
                 primary_col = df.iloc[:, desc_config['primary_column']]
                 primary_desc = primary_col.apply(self._clean_part)
                 
-                # Process secondary columns
-                secondary_parts = []
-                for sec_info in desc_config['secondary_columns']:
-                    sec_col = df.iloc[:, sec_info['index']]
-                    sec_values = sec_col.astype(str).str.strip()
-                    
-                    # Clean secondary values (remove 'nan', empty strings, etc.)
-                    sec_values = sec_col.apply(self._clean_part)
-                    sec_values = sec_values.replace('', pd.NA)
-                    secondary_parts.append(sec_values)
-                
-                # Combine all parts using vectorized operations
+                # Join column by column: a separator goes in only where both
+                # the text so far and the next part are non-empty
                 separator = desc_config.get('separator', ' | ')
-                
-                series_list = [primary_desc] + secondary_parts
-
-                combined_descriptions = (
-                    pd.concat(series_list, axis=1)
-                    .fillna('')
-                    .apply(
-                        lambda row: separator.join(
-                            part.strip()
-                            for part in row
-                            if isinstance(part, str) and part.strip()
-                        ),
-                        axis=1,
-                    )
-                    .str.replace(r"\s+\|\s*$", '', regex=True)
-                )
+                combined = primary_desc.astype(object)
+                for sec_info in desc_config['secondary_columns']:
+                    part = df.iloc[:, sec_info['index']].apply(self._clean_part).astype(object)
+                    both = (combined != '') & (part != '')
+                    combined = (combined + separator + part).where(both, combined + part)
 
-                return combined_descriptions
+                return combined.str.replace(r"\s+\|\s*$", '', regex=True)
             
             else:
                 raise ValueError(f"Unknown description mapping type: {desc_config['type']}")
@@ -520,8 +536,8 @@ class ERPFileProcessor(BaseFileProcessor):
         try:
             if amount_config['type'] == 'single':
                 # Single column mapping
-                amount_col = df.iloc[:, amount_config['column']].astype(str)
-                amounts = amount_col.apply(self._parse_amount)
+                amount_col = df.iloc[:, amount_config['column']]
+                amounts = pd.Series(self._parse_amount_series(amount_col), index=amount_col.index)
                 
                 if amount_config['method'] == 'negate':
                     # Make values negative (for debit columns)
@@ -534,11 +550,10 @@ class ERPFileProcessor(BaseFileProcessor):
                 
             elif amount_config['type'] == 'combined':
                 # Multiple column mapping (Credits/Debits)
-                credits_col = df.iloc[:, amount_config['credits_column']].astype(str)
-                debits_col = df.iloc[:, amount_config['debits_column']].astype(str)
-
-                credits = credits_col.apply(self._parse_amount).fillna(0)
-                debits = debits_col.apply(self._parse_amount).fillna(0)
+                # Both columns come from df, so plain arrays need no index
+                # alignment; _parse_amount_series already filled NaN with 0
+                credits = self._parse_amount_series(df.iloc[:, amount_config['credits_column']])
+                debits = self._parse_amount_series(df.iloc[:, amount_config['debits_column']])
                 
                 if amount_config['method'] == 'credits_minus_debits':
                     # Legacy behaviour: credits positive, debits negative
@@ -553,7 +568,7 @@ class ERPFileProcessor(BaseFileProcessor):
                     # Default to debits positive, credits negative
                     amounts = debits - credits
                 
-                return amounts
+                return pd.Series(amounts, index=df.index)
             
             else:
                 raise ValueError(f"Unknown amount mapping type: {amount_config['type']}")
@@ -577,43 +592,46 @@ class ERPFileProcessor(BaseFileProcessor):
                 # Replace NaN with 0 for numeric columns
                 df[col] = df[col].fillna(0)
         
-        # Step 2: Remove rows where ALL required fields are empty/null
-        required_cols = ['Date', 'Description', 'Amount']
-        available_required = [col for col in required_cols if col in df.columns]
-        
-        if available_required:
-            # Remove rows where all required columns are null/empty
-            df = df.dropna(subset=available_required, how='all')
-        
+        # Steps 2-6 build one row mask so the frame is sliced once rather
+        # than copied by every filter
+        keep = np.ones(len(df), dtype=bool)
+
         # Step 3: Remove rows with invalid/missing dates
         if 'Date' in df.columns:
             # Convert to datetime, coercing errors to NaT
             df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-            df = df.dropna(subset=['Date'])
-            # Remove rows where date couldn't be parsed (NaT values)
-            df = df[df['Date'].notna()]
+            keep &= df['Date'].notna().to_numpy()
         
         # Step 4: Remove rows with missing amounts
         if 'Amount' in df.columns:
             # Convert to numeric, coercing errors to NaN
             df['Amount'] = pd.to_numeric(df['Amount'], errors='coerce')
-            df = df.dropna(subset=['Amount'])
             # Remove rows where amount is 0 or couldn't be parsed
-            df = df[df['Amount'] != 0]
-            df = df[df['Amount'].notna()]
-        
-        # Step 5: Remove rows that look like totals or summaries
+            keep &= (df['Amount'].notna() & (df['Amount'] != 0)).to_numpy(dtype=bool)
+        
+        # Steps 2 and 6: Remove rows where all required fields, or all fields,
+        # are empty/null. Rows kept above have a date or amount, so this only
+        # matters without both columns
+        if 'Date' not in df.columns and 'Amount' not in df.columns:
+            required_cols = ['Date', 'Description', 'Amount']
+            available_required = [col for col in required_cols if col in df.columns]
+            if available_required:
+                keep &= df[available_required].notna().any(axis=1).to_numpy()
+            keep &= df.notna().any(axis=1).to_numpy()
+        
+        # Step 5: Remove rows that look like totals or summaries, scanning only
+        # descriptions that survived the cheaper checks
         if 'Description' in df.columns:
-            # Remove rows with descriptions containing total/summary keywords
-            pattern = r'(total|summary|balance brought forward|carried forward|opening balance|closing balance|grand total|subtotal)'
-            df = df[~df['Description'].str.contains(pattern, case=False, na=False)]
+            descriptions = df['Description'][keep]
+            keep[keep] = ~descriptions.str.contains(_TOTAL_ROW_RE, na=False).to_numpy(dtype=bool)
+        
+        # Taking the rows with a fresh index also lets the string cleanup
+        # below write to a new frame rather than a slice
+        df = df[keep].reset_index(drop=True)
         
         # Log cleaning results
         logger.info(f"ERP data cleaning completed: {len(df)} final rows after removing NaN and invalid data")
         
-        # Step 6: Remove completely blank rows (all fields empty/null)
-        df = df.dropna(how='all')
-        
         # Step 7: Clean string fields
         string_cols = ['Description', 'Reference']
         for col in string_cols:
@@ -623,12 +641,26 @@ class ERPFileProcessor(BaseFileProcessor):
                 # Replace 'nan' strings with empty strings
                 df[col] = df[col].replace(['nan', 'None', 'NaN'], '')
         
-        # Reset index after cleaning
-        df = df.reset_index(drop=True)
+        df = self._optimize_dtypes(df)
         
         logger.info(f"Cleaned ERP data: {len(df)} final rows")
         return df
     
+    def _optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Share one string object per distinct Description/Reference value.
+
+        The columns stay plain ``object`` strings, as consumers expect, rather
+        than ``category``. Amount stays float64: float32 keeps only about 7
+        significant digits, which is too few for money.
+        """
+        for col in ('Description', 'Reference'):
+            if col in df.columns:
+                # factorize hashes in C; taking its uniques by code repeats
+                # references to one string per value instead of copies
+                codes, uniques = pd.factorize(df[col], use_na_sentinel=False)
+                df[col] = pd.Series(np.asarray(uniques, dtype=object).take(codes), index=df.index)
+        return df
+    
     def _calculate_mapping_confidence(self, mapping: Dict[str, Any]) -> float:
         """Calculate confidence score for the mapping (supports multi-column)."""
         required_fields = ['date', 'description', 'amount']
@@ -23,6 +23,7 @@ import logging
 import joblib
 import json
 from pathlib import Path
+from config.constants import MODEL_PICKLE_PROTOCOL
 from models.ml.feature_utils import compute_transaction_features
 
 from sklearn.model_selection import train_test_split, cross_val_score
@@ -366,7 +367,7 @@ class TrainingService:
             'feature_columns': dataset.feature_columns
         }
         
-        joblib.dump(model_data, model_path)
+        joblib.dump(model_data, model_path, protocol=MODEL_PICKLE_PROTOCOL)
         
         # Record version
         self.model_versions.append(model_version)
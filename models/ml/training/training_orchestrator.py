@@ -14,6 +14,8 @@ import numpy as np
 from datetime import datetime
 from sklearn.preprocessing import StandardScaler
 
+from config.constants import MODEL_PICKLE_PROTOCOL
+
 # Import from the training package __init__.py
 from . import (
     TrainingDataset, 
@@ -154,7 +156,7 @@ class TrainingOrchestrator:
             'feature_columns': dataset.feature_columns
         }
         
-        joblib.dump(model_data, model_path)
+        joblib.dump(model_data, model_path, protocol=MODEL_PICKLE_PROTOCOL)
         logger.info(f"Model saved to {model_path}")
     
     def _save_model_versions(self):
@@ -31,7 +31,7 @@ try:  # Optional dependency
 except Exception:  # pragma: no cover - optional
     class joblib:  # type: ignore
         @staticmethod
-        def dump(model, path):
+        def dump(model, path, **kwargs):
             return None
 
         @staticmethod
@@ -41,8 +41,10 @@ from typing import List, Tuple, Optional, Dict
 import logging
 import math
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+import numpy as np
 import pandas as pd
+from config.constants import MODEL_PICKLE_PROTOCOL
 from .data_models import (
     Transaction,
     TransactionMatch,
@@ -108,6 +110,9 @@ class MLEngine:
                 raise ValueError("invalid amount")
 
             dt = self._to_datetime(date_val)
+            if dt.tzinfo is not None:
+                # Matching compares datetime64 values, which carry no zone
+                dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
             amount_bucket = int(round(abs(tx.amount) / amount_tolerance))
             date_bucket = dt.date().toordinal() // date_tolerance
             return dt, amount_bucket, date_bucket
@@ -122,40 +127,47 @@ class MLEngine:
         erp_transactions: List[Transaction],
         amount_tolerance: float,
         date_tolerance: int,
-    ) -> pd.DataFrame:
-        """Create an index of ERP transactions using pandas for fast lookup."""
-        records = []
+    ) -> Dict[str, np.ndarray]:
+        """Index ERP transactions as aligned NumPy columns for vectorized lookup.
+
+        ``amount_bucket``/``date_bucket`` drive candidate selection and
+        ``abs_amount``/``when`` the exact tolerance checks; ``tx`` holds the
+        transactions themselves.
+        """
+        txs, amount_buckets, date_buckets, abs_amounts, whens = [], [], [], [], []
         for tx in erp_transactions:
             validated = self._validate_transaction(tx, 'ERP', amount_tolerance, date_tolerance)
             if not validated:
                 continue
-            _, amount_bucket, date_bucket = validated
-            records.append({
-                'amount_bucket': amount_bucket,
-                'date_bucket': date_bucket,
-                'tx': tx,
-            })
-
-        if not records:
-            return pd.DataFrame(columns=['amount_bucket', 'date_bucket', 'tx'])
-
-        return pd.DataFrame.from_records(records)
+            dt, amount_bucket, date_bucket = validated
+            txs.append(tx)
+            amount_buckets.append(amount_bucket)
+            date_buckets.append(date_bucket)
+            abs_amounts.append(abs(tx.amount))
+            whens.append(dt)
+
+        tx_column = np.empty(len(txs), dtype=object)
+        tx_column[:] = txs
+        return {
+            'amount_bucket': np.array(amount_buckets, dtype=np.int64),
+            'date_bucket': np.array(date_buckets, dtype=np.int64),
+            'abs_amount': np.array(abs_amounts, dtype=np.float64),
+            'when': np.array(whens, dtype='datetime64[us]'),
+            'tx': tx_column,
+        }
 
     def _get_candidate_transactions(
         self,
-        erp_df: pd.DataFrame,
+        erp_index: Dict[str, np.ndarray],
         amount_bucket: int,
         date_bucket: int,
-    ) -> List[Transaction]:
-        """Retrieve candidate ERP transactions for a given bank bucket."""
-        if erp_df.empty:
-            return []
-
+    ) -> np.ndarray:
+        """Positions in ``erp_index`` of ERP candidates for a given bank bucket."""
         mask = (
-            erp_df['amount_bucket'].between(amount_bucket - 1, amount_bucket + 1)
-            & erp_df['date_bucket'].between(date_bucket - 1, date_bucket + 1)
+            (np.abs(erp_index['amount_bucket'] - amount_bucket) <= 1)
+            & (np.abs(erp_index['date_bucket'] - date_bucket) <= 1)
         )
-        return erp_df.loc[mask, 'tx'].tolist()
+        return np.flatnonzero(mask)
 
     def generate_matches(
         self,
@@ -174,7 +186,8 @@ class MLEngine:
         date_tolerance = 7
 
         # Build optimized index of ERP transactions
-        erp_df = self._index_erp_transactions(erp_transactions, amount_tolerance, date_tolerance)
+        erp_index = self._index_erp_transactions(erp_transactions, amount_tolerance, date_tolerance)
+        one_day = np.timedelta64(1, 'D')
         
         # Pre-validate all bank transactions to avoid repeated validation
         validated_bank_transactions = []
@@ -185,28 +198,22 @@ class MLEngine:
 
         # Use vectorized operations where possible
         for bank_tx, (bank_dt, bank_amount_bucket, bank_date_bucket) in validated_bank_transactions:
-            candidate_erps = self._get_candidate_transactions(
-                erp_df, bank_amount_bucket, bank_date_bucket
+            candidates = self._get_candidate_transactions(
+                erp_index, bank_amount_bucket, bank_date_bucket
             )
 
             # Limit candidates to prevent performance issues
-            if len(candidate_erps) > 100:
-                candidate_erps = candidate_erps[:100]
+            candidates = candidates[:100]
 
-            for erp_tx in candidate_erps:
-                try:
-                    erp_date_val = getattr(erp_tx, 'description_date', None) or erp_tx.date
-                    erp_dt = self._to_datetime(erp_date_val)
-                    
-                    # Early exit conditions for performance
-                    amount_diff = abs(abs(bank_tx.amount) - abs(erp_tx.amount))
-                    if amount_diff > amount_tolerance:
-                        continue
-                    
-                    date_diff = abs((bank_dt - erp_dt).days)
-                    if date_diff > date_tolerance:
-                        continue
+            # Amount and date tolerance checks for all candidates at once
+            amount_diff = np.abs(erp_index['abs_amount'][candidates] - abs(bank_tx.amount))
+            date_diff = np.abs(
+                (np.datetime64(bank_dt, 'us') - erp_index['when'][candidates]) // one_day
+            )
+            candidates = candidates[(amount_diff <= amount_tolerance) & (date_diff <= date_tolerance)]
 
+            for erp_tx in erp_index['tx'][candidates]:
+                try:
                     # Calculate match features
                     features = self._extract_features(bank_tx, erp_tx)
                     
@@ -219,7 +226,8 @@ class MLEngine:
 
                     note = self._generate_match_note(features, confidence, confidence_threshold)
 
-                    match = TransactionMatch(
+                    # _predict_match_probability already bounds confidence to [0, 1]
+                    match = TransactionMatch.build_unchecked(
                         bank_transaction=bank_tx,
                         erp_transaction=erp_tx,
                         confidence_score=confidence,
@@ -410,7 +418,7 @@ class MLEngine:
         if self.model is not None and joblib is not None:
             try:
                 self.model_path.parent.mkdir(parents=True, exist_ok=True)
-                joblib.dump(self.model, self.model_path)
+                joblib.dump(self.model, self.model_path, protocol=MODEL_PICKLE_PROTOCOL)
                 self.logger.info(f"Model saved to {self.model_path}")
             except Exception as e:
                 self.logger.error(f"Failed to save model: {e}")
@@ -8,7 +8,10 @@ Text utility functions for transaction processing.
 """
 
 import re
-from typing import Optional
+from typing import Iterable, List, Optional
+
+# Anything that isn't a word character or whitespace
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
 
 
 def normalize_description(description: str, date_str: Optional[str] = None) -> str:
@@ -24,13 +27,19 @@ def normalize_description(description: str, date_str: Optional[str] = None) -> s
     if not description:
         return ""
     
-    # Convert to lowercase and remove extra whitespace
-    normalized = description.lower().strip()
-    
-    # Remove common punctuation and special characters
-    normalized = re.sub(r'[^\w\s]', ' ', normalized)
-    
-    # Remove extra whitespace
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
-    
-    return normalized
+    # Lowercase, replace punctuation with spaces, then collapse and trim
+    # whitespace (str.split splits on the same characters as ``\s``)
+    return ' '.join(_PUNCTUATION_RE.sub(' ', description.lower()).split())
+
+
+def normalize_descriptions(descriptions: Iterable[str]) -> List[str]:
+    """:func:`normalize_description` for many descriptions.
+
+    Each distinct description is normalized once; ERP extracts repeat the
+    same narrative (supplier names, standing orders) many times.
+    """
+    seen = {}
+    return [
+        seen[d] if d in seen else seen.setdefault(d, normalize_description(d))
+        for d in descriptions
+    ]
@@ -201,10 +201,12 @@ class FileBasedConfigurationService(ConfigurationService):
             templates.append(BankTemplate(
                 name=template_def.name,
                 bank_type=template_def.bank_type,
-                header_keywords=template_def.header_keywords,
-                date_patterns=template_def.date_patterns,
-                skip_keywords=template_def.skip_keywords,
-                column_mapping=template_def.column_mapping,
+                header_keywords=list(template_def.header_keywords),
+                date_patterns=list(template_def.date_patterns),
+                skip_keywords=list(template_def.skip_keywords),
+                column_mapping={
+                    key: list(values) for key, values in template_def.column_mapping.items()
+                },
                 description=template_def.description,
                 created_by='system',
                 created_date=datetime.now().isoformat(),
@@ -326,7 +328,7 @@ class FileBasedConfigurationService(ConfigurationService):
     def get_template_by_type(self, bank_type: str) -> Optional[BankTemplate]:
         """Get template by bank type with legacy mapping support"""
         # Handle legacy transformer mappings
-        actual_type = LEGACY_TRANSFORMER_MAPPINGS.get(bank_type, bank_type)
+        actual_type = LEGACY_TRANSFORMER_MAPPINGS.get(bank_type.casefold(), bank_type)
         
         templates = self.get_bank_templates()
         for template in templates:
@@ -565,7 +567,7 @@ class InMemoryConfigurationService(ConfigurationService):
         return self._templates.copy()
     
     def get_template_by_type(self, bank_type: str) -> Optional[BankTemplate]:
-        actual_type = LEGACY_TRANSFORMER_MAPPINGS.get(bank_type, bank_type)
+        actual_type = LEGACY_TRANSFORMER_MAPPINGS.get(bank_type.casefold(), bank_type)
         for template in self._templates:
             if template.bank_type == actual_type:
                 return template
@@ -665,10 +667,12 @@ class InMemoryConfigurationService(ConfigurationService):
             templates.append(BankTemplate(
                 name=template_def.name,
                 bank_type=template_def.bank_type,
-                header_keywords=template_def.header_keywords,
-                date_patterns=template_def.date_patterns,
-                skip_keywords=template_def.skip_keywords,
-                column_mapping=template_def.column_mapping,
+                header_keywords=list(template_def.header_keywords),
+                date_patterns=list(template_def.date_patterns),
+                skip_keywords=list(template_def.skip_keywords),
+                column_mapping={
+                    key: list(values) for key, values in template_def.column_mapping.items()
+                },
                 description=template_def.description,
                 created_by='system',
                 created_date=datetime.now().isoformat(),
@@ -22,6 +22,7 @@ from viewmodels.erp_database_viewmodel import ERPDatabaseViewModel
 from models.data_models import TransactionData, BankStatement
 from services.data_service import DataService
 from services.data_transformation_service import DataTransformationService
+from config.defaults import LEGACY_TRANSFORMER_MAPPINGS
 
 logger = logging.getLogger(__name__)
 
@@ -73,16 +74,9 @@ class ImportWorker(QRunnable):
         if self.template_type:
             template = upload_vm.get_template_by_type(self.template_type)
             if not template:
-                # Try common mappings for your existing templates
-                template_mappings = {
-                    'standard_uk_bank': 'lloyds',
-                    'natwest_bank': 'rbs/natwest', 
-                    'charity_bank': 'lloyds',
-                    'lloyds': 'lloyds',
-                    'rbs': 'rbs/natwest',
-                    'natwest': 'rbs/natwest'
-                }
-                mapped_type = template_mappings.get(self.template_type.lower(), self.template_type.lower())
+                # Try the legacy transformer names for your existing templates
+                template_type = self.template_type.casefold()
+                mapped_type = LEGACY_TRANSFORMER_MAPPINGS.get(template_type, template_type)
                 template = upload_vm.get_template_by_type(mapped_type)
         else:
             # Use first available template as fallback
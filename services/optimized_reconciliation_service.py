@@ -17,6 +17,8 @@ from datetime import datetime, timedelta
 import logging
 from dataclasses import dataclass
 from collections import defaultdict
+from functools import lru_cache
+import re
 import time
 
 from models.data_models import TransactionData, TransactionMatch, MatchStatus
@@ -24,6 +26,17 @@ from services.data_transformation_service import DataTransformationService
 
 logger = logging.getLogger(__name__)
 
+_DESCRIPTION_NOISE_RE = re.compile(r'[^\w\s\-\.]')
+
+
+@lru_cache(maxsize=65536)
+def _normalize_description_cached(text: str) -> str:
+    """Normalize a description once; every candidate pair reuses the result."""
+    # Convert to lowercase and collapse whitespace to single spaces
+    text = ' '.join(str(text).lower().split())
+    # Keep numbers and common separators that might be important for matching
+    return _DESCRIPTION_NOISE_RE.sub(' ', text).strip()
+
 @dataclass
 class ReconciliationConfig:
     """Configuration for reconciliation process"""
@@ -447,19 +460,7 @@ class OptimizedReconciliationService:
         """Improved description normalization that preserves important matching information"""
         if not text:
             return ""
-        
-        # Convert to lowercase and strip whitespace
-        text = str(text).lower().strip()
-        
-        # Remove extra whitespace but preserve single spaces
-        text = ' '.join(text.split())
-        
-        # Keep numbers and common separators that might be important for matching
-        # Only remove truly problematic characters
-        import re
-        text = re.sub(r'[^\w\s\-\.]', ' ', text)
-        
-        return text.strip()
+        return _normalize_description_cached(text)
     
     def _calculate_partial_match_score(self, desc1: str, desc2: str) -> float:
         """Calculate partial match score similar to Excel's fuzzy matching"""
@@ -6,6 +6,13 @@ from typing import List
 import re
 from difflib import SequenceMatcher
 
+try:  # Optional dependency
+    import numpy as np
+    from rapidfuzz import fuzz, process  # type: ignore
+except Exception:  # pragma: no cover - optional
+    fuzz = None
+    process = None
+
 @dataclass
 class TransactionRecord:
     """Minimal transaction representation used for reconciliation."""
@@ -59,25 +66,82 @@ def _calculate_fuzzy_similarity(text1: str, text2: str) -> float:
     if norm1 == norm2:
         return 1.0
     
-    # Use SequenceMatcher for fuzzy matching
-    matcher = SequenceMatcher(None, norm1, norm2)
+    return _difflib_similarity(SequenceMatcher(None, norm1, norm2), norm1, norm2)
+
+
+def _difflib_similarity(matcher: SequenceMatcher, norm1: str, norm2: str) -> float:
+    """Best of the plain and word-order-independent ratios.
+
+    ``matcher`` must already compare ``norm1`` with ``norm2``; it is passed
+    in so callers can reuse one matcher per second sequence.
+    """
     basic_ratio = matcher.ratio()
-    
-    # Also try token-based matching (order-independent)
-    # Split into words and sort them
+
+    # Also try with sorted tokens for better matching of reordered words
     tokens1 = sorted(norm1.split())
     tokens2 = sorted(norm2.split())
-    
     if tokens1 and tokens2:
-        token_matcher = SequenceMatcher(None, " ".join(tokens1), " ".join(tokens2))
-        token_ratio = token_matcher.ratio()
-        
-        # Take the higher of the two scores
-        return max(basic_ratio, token_ratio)
-    
+        sorted_ratio = SequenceMatcher(None, " ".join(tokens1), " ".join(tokens2)).ratio()
+        return max(basic_ratio, sorted_ratio)
+
     return basic_ratio
 
 
+def _fuzzy_similarity_matrix(
+    bank_descriptions: List[str],
+    gl_descriptions: List[str],
+    min_similarity: float = 0.0,
+):
+    """:func:`_calculate_fuzzy_similarity` for every bank/GL pair at once.
+
+    Scores below ``min_similarity`` may be reported as 0. With rapidfuzz,
+    returns a numpy array: rapidfuzz's ratios (2 * LCS / total length)
+    bound difflib's from above, since difflib's matching blocks form a
+    common subsequence. So whole N x M bound matrices are computed in C and
+    difflib only scores the pairs that can reach ``min_similarity``, once
+    per distinct pair of normalized texts.
+    """
+    if process is None:
+        return [
+            [_calculate_fuzzy_similarity(b, g) for g in gl_descriptions]
+            for b in bank_descriptions
+        ]
+
+    norm_bank = [_normalize_description(d) if d else "" for d in bank_descriptions]
+    norm_gl = [_normalize_description(d) if d else "" for d in gl_descriptions]
+    unique_bank, bank_inverse = np.unique(np.array(norm_bank, dtype=object), return_inverse=True)
+    unique_gl, gl_inverse = np.unique(np.array(norm_gl, dtype=object), return_inverse=True)
+
+    bound = np.maximum(
+        process.cdist(unique_bank, unique_gl, scorer=fuzz.ratio, dtype=np.float64, workers=-1),
+        process.cdist(
+            unique_bank, unique_gl, scorer=fuzz.token_sort_ratio, dtype=np.float64, workers=-1
+        ),
+    ) / 100.0
+    scores = np.zeros_like(bound)
+    # Slack for rounding in the bound; exact ties must still be scored
+    rows, cols = np.nonzero(bound >= min_similarity - 1e-9)
+    matchers = {}
+    for i, j in zip(rows.tolist(), cols.tolist()):
+        b, g = unique_bank[i], unique_gl[j]
+        # SequenceMatcher caches its analysis of the second sequence
+        if g not in matchers:
+            matchers[g] = SequenceMatcher(None, "", g)
+        matcher = matchers[g]
+        matcher.set_seq1(b)
+        scores[i, j] = _difflib_similarity(matcher, b, g)
+
+    # The scalar version's special cases: equal normalized text scores 1
+    # and empty input scores 0
+    scores[unique_bank[:, None] == unique_gl[None, :]] = 1.0
+    matrix = scores[np.ix_(bank_inverse.ravel(), gl_inverse.ravel())]
+    empty_bank = np.array([not d for d in bank_descriptions], dtype=bool)
+    empty_gl = np.array([not d for d in gl_descriptions], dtype=bool)
+    matrix[empty_bank, :] = 0.0
+    matrix[:, empty_gl] = 0.0
+    return matrix
+
+
 def _extract_description_date(text: str) -> date | None:
     """Extract a date embedded in the description if present."""
     match = re.search(r"(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", text)
@@ -117,12 +181,19 @@ def reconcile_transactions(
     """
 
     matches: List[ReconciledMatch] = []
-    for bank_tx in bank_transactions:
+    if fuzzy_matching:
+        desc_matrix = _fuzzy_similarity_matrix(
+            [tx.description for tx in bank_transactions],
+            [tx.description for tx in gl_transactions],
+            min_description_similarity,
+        )
+
+    for i, bank_tx in enumerate(bank_transactions):
         best_gl: TransactionRecord | None = None
         best_score = 0.0
         bank_date = datetime.fromisoformat(str(bank_tx.date)).date()
         
-        for gl_tx in gl_transactions:
+        for j, gl_tx in enumerate(gl_transactions):
             gl_date = datetime.fromisoformat(str(gl_tx.date)).date()
 
             # Base similarity metrics - amounts are compared using a unified sign
@@ -143,7 +214,7 @@ def reconcile_transactions(
             
             # ENHANCED: Use fuzzy matching for descriptions
             if fuzzy_matching:
-                desc_score = _calculate_fuzzy_similarity(bank_tx.description, gl_tx.description)
+                desc_score = desc_matrix[i][j]
                 # Apply minimum threshold for fuzzy matching
                 if desc_score < min_description_similarity:
                     desc_score = 0.0
@@ -62,6 +62,12 @@ def test_settings_save_logs_error(caplog):
     settings = AppSettings()
 
     class BrokenSettings:
+        def beginGroup(self, *_):
+            pass
+
+        def endGroup(self):
+            pass
+
         def setValue(self, *_, **__):
             raise OSError("disk full")
 
@@ -0,0 +1,44 @@
+from dataclasses import asdict
+
+import pandas as pd
+
+from models.data_models import BankStatement, TransactionData
+
+
+def test_transaction_id_is_an_ordinary_field():
+    first = TransactionData(date="2024-01-01", description="Pay", amount=1.0, transaction_id="t1")
+    second = TransactionData(date="2024-01-01", description="Pay", amount=1.0, transaction_id="t1")
+
+    assert first.transaction_id == "t1"
+    assert first == second
+    assert "transaction_id='t1'" in repr(first)
+    assert asdict(first)["transaction_id"] == "t1"
+    assert "_transaction_id" not in asdict(first)
+
+
+def test_transaction_ids_are_generated_when_missing():
+    generated = TransactionData(date="2024-01-01", description="Pay", amount=1.0)
+    frame = pd.DataFrame({
+        "date": ["2024-01-01", "2024-01-02"],
+        "description": ["Pay", "Refund"],
+        "amount": [1.0, 2.0],
+        "transaction_id": ["kept", None],
+    })
+    kept, filled = TransactionData.from_dataframe(frame)
+
+    assert len(generated.transaction_id) == 32
+    assert kept.transaction_id == "kept"
+    assert len({generated.transaction_id, filled.transaction_id}) == 2
+
+
+def test_to_dataframe_keeps_categories_as_strings():
+    transactions = [
+        TransactionData(date="2024-01-01", description="Pay", amount=1.0, category="fees"),
+        TransactionData(date="2024-01-02", description="Pay", amount=2.0),
+    ]
+    df = BankStatement("TestBank", None, "", transactions).to_dataframe()
+
+    assert df["category"].dtype == object
+    assert df["category"].tolist() == ["fees", None]
+    df.loc[1, "category"] = "income"
+    assert df["category"].tolist() == ["fees", "income"]
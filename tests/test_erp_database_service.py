@@ -0,0 +1,204 @@
+import sqlite3
+from datetime import date
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from models import database_models
+from models.database_models import DatabaseConnection, ERPQueryTemplate
+from models.erp_database_service import BoundedDFCache, ERPDatabaseService
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    cache = BoundedDFCache(max_entries=2)
+    cache.put("a", pd.DataFrame({"x": [1]}))
+    cache.put("b", pd.DataFrame({"x": [2]}))
+    cache.get("a")
+    cache.put("c", pd.DataFrame({"x": [3]}))
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+
+
+def test_bounded_cache_invalidates_by_source_table():
+    template = ERPQueryTemplate(
+        name="gl",
+        description="",
+        sql_query='SELECT * FROM GL.Journal j JOIN "Accounts" a ON a.id = j.account_id',
+    )
+    assert template.source_tables() == {"gl.journal", "accounts"}
+
+    cache = BoundedDFCache()
+    cache.put("gl", pd.DataFrame({"x": [1]}), template.source_tables())
+    cache.put("other", pd.DataFrame({"x": [2]}), frozenset({"vendors"}))
+
+    assert cache.invalidate({"accounts"}) == 1
+    assert "gl" not in cache and "other" in cache
+
+
+def test_transaction_frame_matches_transaction_list():
+    df = pd.DataFrame({
+        "date": ["2024-01-01", "2024-01-02", None],
+        "description": ["Pay!", "Refund", "Fee"],
+        "amount": ["1.5", "2", "3"],
+        "reference": [None, "R1", "R2"],
+    })
+    service = ERPDatabaseService()
+
+    frame = service.convert_to_transaction_frame(df, {})
+    transactions = service.convert_to_transactions(df, {})
+
+    assert list(frame.amount) == [1.5, 2.0]
+    assert [(t.date, t.amount, t.reference, t.normalized_description) for t in frame] == [
+        (t.date, t.amount, t.reference, t.normalized_description) for t in transactions
+    ]
+
+
+def test_projection_narrows_select_star():
+    template = ERPQueryTemplate(
+        name="gl",
+        description="",
+        sql_query="select * from gl_lines where period = :period",
+        projection=["line_date", "narrative", "amount"],
+    )
+    assert template.projected_sql() == (
+        "SELECT line_date, narrative, amount from gl_lines where period = :period"
+    )
+
+    template.projection = ["amount; drop table gl_lines"]
+    assert "Invalid projection columns" in " ".join(template.validate_query()[1])
+
+
+def _sqlite_service(tmp_path, rows, **service_kwargs):
+    db_file = tmp_path / "erp.db"
+    with sqlite3.connect(db_file) as conn:
+        conn.execute("CREATE TABLE gl (date TEXT, description TEXT, amount REAL, reference TEXT)")
+        conn.executemany("INSERT INTO gl VALUES (?, ?, ?, ?)", rows)
+    conn.close()
+
+    service = ERPDatabaseService(**service_kwargs)
+    service.add_connection(DatabaseConnection(
+        name="erp", connection_type="sqlite", host="", port=0, database=str(db_file),
+        username="", connection_string=f"sqlite:///{db_file}",
+    ))
+    service.add_query_template(ERPQueryTemplate(
+        name="gl", description="", sql_query="SELECT * FROM gl", connection_name="erp",
+    ))
+    return service
+
+
+def test_null_query_values_are_skipped_not_stringified(tmp_path):
+    service = _sqlite_service(tmp_path, [
+        ("2024-01-01", "Pay", 1.5, None),
+        (None, "No date", 2.0, "R1"),
+        ("2024-01-03", None, 3.0, "R2"),
+        ("2024-01-04", "No amount", None, "R3"),
+    ])
+
+    success, df, _ = service.execute_query("gl", {})
+    transactions = service.convert_to_transactions(df, {})
+
+    assert success
+    assert [(t.date, t.description, t.amount, t.reference) for t in transactions] == [
+        ("2024-01-01", "Pay", 1.5, None)
+    ]
+
+
+class _FakeOracleFrame:
+    """The parts of python-oracledb's DataFrame that _fetch_arrow_frame uses."""
+
+    def __init__(self, table):
+        self._table = table
+
+    def column_arrays(self):
+        return self._table.columns
+
+    def column_names(self):
+        return self._table.column_names
+
+
+def test_arrow_fetch_nulls_are_skipped(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({
+        "DATE": pa.array([date(2024, 1, 1), None, date(2024, 1, 3)]),
+        "DESCRIPTION": pa.array(["Pay", "No date", None]),
+        "AMOUNT": pa.array([1.5, 2.0, None]),
+        "REFERENCE": pa.array([None, "R1", "R2"]),
+    })
+    driver = SimpleNamespace(fetch_df_all=lambda **kwargs: _FakeOracleFrame(table))
+    conn = SimpleNamespace(connection=SimpleNamespace(driver_connection=driver))
+    template = ERPQueryTemplate(name="gl", description="", sql_query="SELECT * FROM gl")
+
+    df = ERPDatabaseService._fetch_arrow_frame(conn, template, {})
+    transactions = ERPDatabaseService().convert_to_transactions(df, {})
+
+    assert list(df.columns) == ["date", "description", "amount", "reference"]
+    assert [(t.date, t.description, t.amount, t.reference) for t in transactions] == [
+        ("2024-01-01", "Pay", 1.5, None)
+    ]
+
+
+def test_disk_cache_is_not_served_after_template_edit(tmp_path):
+    pytest.importorskip("pyarrow")
+    cache_dir = tmp_path / "cache"
+    service = _sqlite_service(tmp_path, [("2024-01-01", "Pay", 1.5, None)], disk_cache_dir=str(cache_dir))
+    assert service.execute_query("gl", {})[1]["amount"].tolist() == [1.5]
+
+    # A fresh service (as after a restart) with an edited template
+    restarted = ERPDatabaseService(disk_cache_dir=str(cache_dir))
+    restarted.add_connection(service.connections["erp"])
+    restarted.add_query_template(ERPQueryTemplate(
+        name="gl", description="", sql_query="SELECT date, amount * 2 AS amount FROM gl",
+        connection_name="erp",
+    ))
+    success, df, message = restarted.execute_query("gl", {})
+
+    assert success and message != "Cached result"
+    assert df["amount"].tolist() == [3.0]
+
+
+def test_failed_query_is_retried_on_next_call(tmp_path):
+    service = _sqlite_service(tmp_path, [])
+    service.add_query_template(ERPQueryTemplate(
+        name="late", description="", sql_query="SELECT * FROM late_table", connection_name="erp",
+    ))
+    assert service.execute_query("late", {})[0] is False
+
+    with sqlite3.connect(tmp_path / "erp.db") as conn:
+        conn.execute("CREATE TABLE late_table (x INTEGER)")
+        conn.execute("INSERT INTO late_table VALUES (1)")
+    conn.close()
+
+    success, df, _ = service.execute_query("late", {})
+    assert success and df["x"].tolist() == [1]
+
+
+@pytest.mark.parametrize(
+    "sql, allowed",
+    [
+        ("SELECT * FROM gl", True),
+        ("SELECT * FROM gl; DROP TABLE gl", False),
+        ("SELECT * FROM gl WHERE 1=1; delete from gl", False),
+        ("select * from gl_truncated", False),
+        ("SELECT dropdown_value FROM settings", False),
+        ("UPDATE gl SET amount = 0", False),
+    ],
+)
+def test_validate_query_rejects_destructive_sql(sql, allowed):
+    template = ERPQueryTemplate(name="q", description="", sql_query=sql)
+    assert template.validate_query()[0] is allowed
+
+
+def test_connection_string_follows_password_rotation():
+    connection = DatabaseConnection(
+        name="erp", connection_type="postgresql", host="db", port=5432,
+        database="ledger", username="app", password="old-secret",
+    )
+    assert connection.get_connection_string() == "postgresql://app:old-secret@db:5432/ledger"
+
+    connection.password = "new-secret"
+    assert connection.get_connection_string() == "postgresql://app:new-secret@db:5432/ledger"
+    # The memoized parts never contain the password
+    parts = database_models._connection_string_parts("postgresql", "app", "db", 5432, "ledger", None)
+    assert "secret" not in "".join(parts)
@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 
 from models.erp_file_processor import ERPFileProcessor
 from config import load_config
@@ -70,4 +71,41 @@ def test_amount_mapping_credits_positive(monkeypatch):
     processor = ERPFileProcessor()
     mapping = processor._detect_amount_columns([c.lower() for c in df.columns], list(df.columns))
     amounts = processor._process_amount_mapping(df, mapping)
-    assert amounts.to
\ No newline at end of file
+    assert amounts.to
+
+def test_clean_erp_data_returns_plain_strings():
+    df = pd.DataFrame({
+        "Date": pd.to_datetime(["2024-01-01"] * 10),
+        "Description": [f"Payment {i}" for i in range(10)],
+        "Amount": [12345.67] * 10,
+        "Reference": ["BACS "] * 10,
+    })
+    cleaned = ERPFileProcessor()._clean_erp_data(df)
+
+    assert cleaned["Reference"].dtype == object
+    assert cleaned["Reference"].tolist() == ["BACS"] * 10
+    # Repeated values share one string object
+    assert cleaned["Reference"][0] is cleaned["Reference"][9]
+    # Consumers fill and compare with arbitrary strings
+    assert cleaned["Reference"].replace("BACS", "CHAPS").eq("CHAPS").all()
+    assert cleaned["Description"].tolist() == [f"Payment {i}" for i in range(10)]
+    assert cleaned["Amount"].dtype == "float64"
+
+
+@pytest.mark.parametrize(
+    "positive_credits, method",
+    [(True, "credits_minus_debits"), (False, "debits_minus_credits")],
+)
+def test_credits_and_debits_use_configured_method(monkeypatch, positive_credits, method):
+    df = pd.DataFrame({
+        "Date": ["2024-01-01", "2024-01-02"],
+        "Credits": [10, 0],
+        "Debits": [0, 4],
+    })
+    monkeypatch.setattr(CONFIG, "ERP_POSITIVE_CREDITS", positive_credits)
+    processor = ERPFileProcessor()
+    mapping = processor._detect_amount_columns([c.lower() for c in df.columns], list(df.columns))
+
+    assert mapping["method"] == method
+    amounts = processor._process_amount_mapping(df, mapping)
+    assert amounts.tolist() == ([10, -4] if positive_credits else [-10, 4])
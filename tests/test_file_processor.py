@@ -1,9 +1,14 @@
+import gc
+import os
+import weakref
+
 import pandas as pd
 import pytest
 from unittest.mock import MagicMock
 
+from models import base_file_processor
 from models.bank_file_processor import BankFileProcessor
-from models.data_models import BankTemplate
+from models.data_models import BankStatement, BankTemplate, TransactionData, build_header_index
 
 
 def make_file_processor():
@@ -92,3 +97,144 @@ def test_find_header_row_with_keywords():
     ])
     fp = make_file_processor()
     assert fp.find_header_row(df, ["date", "amount"]) == 1
+
+
+def test_read_file_chunked_starts_at_header(tmp_path):
+    csv_path = tmp_path / "statement.csv"
+    rows = "".join(f"0{i % 9 + 1}/01/2024,Payment {i},{i}.00\n" for i in range(5))
+    csv_path.write_text("Account,123,\nDate,Description,Amount\n" + rows)
+
+    fp = make_file_processor()
+    chunks = list(fp.read_file_chunked(csv_path, ["date", "description", "amount"], chunksize=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert list(chunks[0].columns) == ["Date", "Description", "Amount"]
+    assert chunks[-1].iloc[0]["Description"] == "Payment 4"
+
+
+def test_parse_amount_series_matches_scalar():
+    fp = make_file_processor()
+    values = ["£1,234.50", "(12.00)", "-5", "", "notanumber", "  7 "]
+    parsed = fp._parse_amount_series(pd.Series(values, dtype="object"))
+    assert list(parsed) == [fp._parse_amount(v) for v in values]
+
+
+def test_map_columns_accepts_prebuilt_header_index():
+    template = BankTemplate(
+        name="TestBank",
+        bank_type="custom",
+        header_keywords=["date"],
+        date_patterns=[],
+        skip_keywords=[],
+        column_mapping={"date": ["Date"], "amount": ["Amount (£)", "amount"]},
+    )
+    headers = ["date", "description", "amount"]
+
+    index = build_header_index(headers)
+    assert template.map_columns(index) == template.map_columns(headers) == {"date": [0], "amount": [2]}
+
+
+def test_transaction_data_from_dataframe():
+    df = pd.DataFrame({
+        "date": ["01/01/2024", "02/01/2024"],
+        "description": ["Payment", "Refund"],
+        "amount": ["10.5", "-3"],
+        "reference": ["REF1", None],
+    })
+    transactions = TransactionData.from_dataframe(df)
+
+    assert [t.amount for t in transactions] == [10.5, -3.0]
+    assert transactions[1].reference is None
+    assert transactions[0].transaction_id != transactions[1].transaction_id
+
+
+def test_transaction_data_from_dataframe_reports_all_bad_rows():
+    df = pd.DataFrame({
+        "date": ["01/01/2024", "", "03/01/2024"],
+        "description": ["Payment", "Refund", "Fee"],
+        "amount": ["10", "5", "abc"],
+    })
+    with pytest.raises(ValueError, match=r"\[1, 2\]"):
+        TransactionData.from_dataframe(df)
+
+
+def test_bank_statement_frame_tracks_transactions():
+    transactions = [TransactionData("01/01/2024", "Payment", 10.0)]
+    statement = BankStatement("TestBank", None, "", transactions)
+    assert statement.frame.amount.sum() == 10.0
+
+    transactions.append(TransactionData("02/01/2024", "Refund", -2.5))
+    assert list(statement.frame.amount) == [10.0, -2.5]
+
+
+def test_read_file_rereads_modified_file(tmp_path):
+    csv_path = tmp_path / "sample.csv"
+    csv_path.write_text("a,b\n1,2\n")
+
+    fp = make_file_processor()
+    first = fp.read_file(csv_path)
+    first.iloc[0, 0] = "changed"
+    assert fp.read_file(csv_path).iloc[0, 0] == "a"
+
+    csv_path.write_text("a,b\n1,2\n3,4\n")
+    assert fp.read_file(csv_path).shape == (3, 2)
+
+
+def test_read_files_preserves_order(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"sample{i}.csv"
+        path.write_text(f"a,b\n{i},{i}\n")
+        paths.append(path)
+
+    fp = make_file_processor()
+    frames = fp.read_files(paths)
+
+    assert [df.iloc[1, 0] for df in frames] == ["0", "1", "2"]
+
+
+def test_read_file_chunked_handles_blank_lines_and_legacy_encoding(tmp_path):
+    csv_path = tmp_path / "statement.csv"
+    rows = "".join(f"0{i + 1}/01/2024,Caf\xe9 {i},{i}.00\n" for i in range(3))
+    csv_path.write_bytes(
+        ("Account,123,\n\n\nDate,Description,Amount\n" + rows).encode("cp1252")
+    )
+
+    fp = make_file_processor()
+    chunks = list(fp.read_file_chunked(csv_path, ["date", "description", "amount"], chunksize=2))
+
+    assert list(chunks[0].columns) == ["Date", "Description", "Amount"]
+    assert sum(len(chunk) for chunk in chunks) == 3
+    assert chunks[0].iloc[0]["Description"] == "Caf\xe9 0"
+
+
+def test_read_file_cache_sees_same_size_rewrite_in_same_mtime(tmp_path, monkeypatch):
+    monkeypatch.setattr(base_file_processor, "_RACY_MTIME_NS", -1)
+    csv_path = tmp_path / "sample.csv"
+    csv_path.write_text("a,b\n1,2\n")
+    os.utime(csv_path, ns=(1_700_000_000_000_000_000,) * 2)
+
+    fp = make_file_processor()
+    assert fp.read_file(csv_path).iloc[1, 0] == "1"
+
+    csv_path.write_text("a,b\n3,4\n")
+    os.utime(csv_path, ns=(1_700_000_000_000_000_000,) * 2)
+    assert fp.read_file(csv_path).iloc[1, 0] == "3"
+
+
+def test_read_file_cache_does_not_keep_processors_alive(tmp_path, monkeypatch):
+    monkeypatch.setattr(base_file_processor, "_RACY_MTIME_NS", -1)
+    csv_path = tmp_path / "sample.csv"
+    csv_path.write_text("a,b\n1,2\n")
+
+    fp = BankFileProcessor(None)
+    fp.read_file(csv_path)
+    ref = weakref.ref(fp)
+    del fp
+    gc.collect()
+
+    assert ref() is None
+    # Other processors share the cached frame
+    other = BankFileProcessor(None)
+    monkeypatch.setattr(other, "_read_file_uncached", None)
+    assert other.read_file(csv_path).shape == (2, 2)
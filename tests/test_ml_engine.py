@@ -1,6 +1,7 @@
 import sys
+import warnings
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -115,3 +116,38 @@ def test_load_model_reads_from_model_path():
         engine.load_model()
         mock_load.assert_called_once_with(engine.model_path)
         assert engine.model == "model"
+
+
+def test_build_unchecked_matches_constructor(make_bank_transaction, make_erp_transaction):
+    bank = make_bank_transaction("b1", 100)
+    erp = make_erp_transaction("e1", 100)
+
+    unchecked = TransactionMatch.build_unchecked(bank, erp, 0.9, 1.0, 0.8, 0.7, match_note="note")
+    checked = TransactionMatch(bank, erp, 0.9, 1.0, 0.8, 0.7, match_note="note")
+
+    assert unchecked == checked
+
+
+def test_generate_matches_handles_timezone_aware_dates(make_bank_transaction, make_erp_transaction):
+    engine = MLEngine(model_path="dummy.pkl")
+    bank = [
+        BankTransaction(
+            id="b1",
+            date=datetime(2023, 1, 1, 23, 30, tzinfo=timezone(timedelta(hours=-5))),
+            description="Payment",
+            amount=100,
+        ),
+        make_bank_transaction("b2", 200),
+    ]
+    erp = [
+        ERPTransaction(
+            id="e1", date=datetime(2023, 1, 2, 4, 30, tzinfo=timezone.utc), description="Payment", amount=100
+        ),
+        make_erp_transaction("e2", 200),
+    ]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        matches = engine.generate_matches(bank, erp, confidence_threshold=0.0)
+
+    assert sorted((m.bank_transaction.id, m.erp_transaction.id) for m in matches) == [("b1", "e1"), ("b2", "e2")]
@@ -28,4 +28,40 @@ def test_no_match_without_description_date():
     gl = TransactionRecord(date="2024-05-12", description="Payment", amount=100.0)
 
     matches = reconcile_transactions([bank], [gl])
-    assert matches == []
\ No newline at end of file
+    assert matches == []
+
+
+def _difflib_score(text1, text2):
+    """The original difflib scorer, kept here as the reference."""
+    from difflib import SequenceMatcher
+
+    if not text1 or not text2:
+        return 0.0
+    norm1 = reconcile_mod._normalize_description(text1)
+    norm2 = reconcile_mod._normalize_description(text2)
+    if norm1 == norm2:
+        return 1.0
+    basic_ratio = SequenceMatcher(None, norm1, norm2).ratio()
+    tokens1 = sorted(norm1.split())
+    tokens2 = sorted(norm2.split())
+    if tokens1 and tokens2:
+        token_ratio = SequenceMatcher(None, " ".join(tokens1), " ".join(tokens2)).ratio()
+        return max(basic_ratio, token_ratio)
+    return basic_ratio
+
+
+def test_similarity_scores_match_difflib():
+    bank = ["Payment ACME Ltd", "acme ltd payment", "", "1234", "Card fee", "Payment ACME Ltd", "Transfer to savings"]
+    gl = ["ACME Ltd Payment 09/05/2024", "Bank charges", "5678", "card fees", "", "Savings transfer"]
+    threshold = 0.3
+
+    matrix = reconcile_mod._fuzzy_similarity_matrix(bank, gl, threshold)
+
+    for i, b in enumerate(bank):
+        for j, g in enumerate(gl):
+            expected = _difflib_score(b, g)
+            assert reconcile_mod._calculate_fuzzy_similarity(b, g) == expected
+            if expected >= threshold:
+                assert matrix[i][j] == expected
+            else:
+                assert matrix[i][j] < threshold
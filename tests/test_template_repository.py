@@ -0,0 +1,86 @@
+import json
+
+from models.data_models import BankTemplate
+from models.database import TemplateRepository
+
+
+def _template(bank_type: str, **overrides) -> BankTemplate:
+    fields = dict(
+        name=bank_type.title(),
+        bank_type=bank_type,
+        header_keywords=["date", "amount"],
+        date_patterns=[r"\d{2}/\d{2}/\d{4}"],
+        skip_keywords=["balance"],
+        column_mapping={"date": ["date"], "amount": ["amount"]},
+    )
+    fields.update(overrides)
+    return BankTemplate(**fields)
+
+
+def _repository(tmp_path) -> TemplateRepository:
+    return TemplateRepository(
+        templates_file=str(tmp_path / "bank_templates.json"),
+        db_file=str(tmp_path / "audit.db"),
+    )
+
+
+def test_save_get_and_delete(tmp_path):
+    repo = _repository(tmp_path)
+    assert repo.save_template(_template("lloyds"))
+    assert repo.save_template(_template("lloyds", skip_rows=3))
+
+    assert repo.get_template_by_type("lloyds").skip_rows == 3
+    assert [t.bank_type for t in repo.get_all_templates()] == ["lloyds"]
+
+    assert repo.delete_template("lloyds")
+    assert repo.get_template_by_type("lloyds") is None
+    assert repo.get_all_templates() == []
+    repo.close()
+
+
+def test_templates_survive_reopen_and_other_writers(tmp_path):
+    repo = _repository(tmp_path)
+    lloyds = _template("lloyds")
+    repo.save_template(lloyds)
+    repo.get_all_templates()
+
+    other = _repository(tmp_path)
+    assert other.get_template_by_type("lloyds") == lloyds
+    other.save_template(_template("barclays"))
+    other.close()
+
+    # The first connection sees the other's commit despite its cache
+    assert {t.bank_type for t in repo.get_all_templates()} == {"lloyds", "barclays"}
+    repo.close()
+
+
+def test_legacy_file_is_imported_only_once(tmp_path):
+    legacy = {"templates": {"hsbc": _template("hsbc").to_dict()}}
+    (tmp_path / "bank_templates.json").write_text(json.dumps(legacy))
+
+    repo = _repository(tmp_path)
+    assert repo.get_template_by_type("hsbc").name == "Hsbc"
+    repo.delete_template("hsbc")
+    repo.close()
+
+    reopened = _repository(tmp_path)
+    assert reopened.get_all_templates() == []
+    reopened.close()
+
+
+def test_returned_templates_do_not_share_state_with_cache(tmp_path):
+    repo = _repository(tmp_path)
+    saved = _template("lloyds")
+    repo.save_template(saved)
+    saved.header_keywords.append("saved-later")
+
+    fetched = repo.get_template_by_type("lloyds")
+    fetched.header_keywords.append("X")
+    fetched.column_mapping["date"].append("Y")
+    repo.get_all_templates()[0].skip_keywords.append("Z")
+
+    unchanged = repo.get_template_by_type("lloyds")
+    assert unchanged.header_keywords == ["date", "amount"]
+    assert unchanged.column_mapping["date"] == ["date"]
+    assert unchanged.skip_keywords == ["balance"]
+    repo.close()
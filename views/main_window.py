@@ -24,6 +24,7 @@ import pandas as pd
 from services.app_container import get_config_service, get_account_service, get_upload_viewmodel
 
 from services.data_service import DataService
+from config.defaults import LEGACY_TRANSFORMER_MAPPINGS
 from .dialogs.dialog_manager import DialogManager
 
 
@@ -1021,13 +1022,8 @@ class MainWindow(QMainWindow):
                 
                 template = self.upload_viewmodel.get_template_by_type(transformer)
                 if template is None:
-                    mapping = {
-                        'standard_uk_bank': 'lloyds',
-                        'Natwest_bank': 'rbs/natwest',
-                        'Charity_bank': 'lloyds',
-                    }
                     template = self.upload_viewmodel.get_template_by_type(
-                        mapping.get(transformer, transformer)
+                        LEGACY_TRANSFORMER_MAPPINGS.get(transformer.casefold(), transformer)
                     )
 
                 if template is None:
@@ -1325,8 +1321,7 @@ class MainWindow(QMainWindow):
         
         # Get bank total from data service
         if self.data_service.bank_statement:
-            bank_df = self.data_service.bank_statement.to_dataframe()
-            bank_total = bank_df['amount'].sum()
+            bank_total = float(self.data_service.bank_statement.frame.amount.sum())
         
         # Get ERP total from data service
         if self.data_service.erp_transactions:
@@ -1370,8 +1365,7 @@ class MainWindow(QMainWindow):
         
         # Get bank total from data service
         if self.data_service.bank_statement:
-            bank_df = self.data_service.bank_statement.to_dataframe()
-            bank_total = bank_df['amount'].sum()
+            bank_total = float(self.data_service.bank_statement.frame.amount.sum())
         
         # Get ERP total from data service
         if self.data_service.erp_transactions: